@@ -37,7 +37,11 @@ setup(
         "rich>=13.7.0",
         "psutil>=5.9.8",
         "click>=8.1.7",
+        "msgpack>=1.0",
     ],
+    extras_require={
+        'fast': ["orjson>=3.9.0"],
+    },
     entry_points={
         'console_scripts': [
             'steam-fixer=src.main:main',
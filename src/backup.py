@@ -3,15 +3,223 @@ Steam Library Fixer - Backup Manager Module
 Handles backup and restore operations for Steam configuration files.
 """
 
+import os
+import sys
 import shutil
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Optional
-from dataclasses import dataclass, asdict
+from typing import List, Dict, Optional, Tuple, Union
+from dataclasses import dataclass
+from .utils import DATACLASS_SLOTS
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+if sys.platform.startswith('linux'):
+    import fcntl
+elif sys.platform == 'darwin':
+    import ctypes
+    import ctypes.util
+
+    # Loaded once; every backed up file goes through clonefile(2)
+    _libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+
+# ioctl request number for FICLONE (_IOW(0x94, 9, int)) on Linux
+_FICLONE = 0x40049409
+
+# Manifest file names; msgpack is preferred, JSON is the legacy/human-readable form
+_MANIFEST_MSGPACK = "manifest.msgpack"
+_MANIFEST_JSON = "manifest.json"
+
+# Upper bound on threads used to copy files concurrently
+_MAX_COPY_WORKERS = 32
+
+# Buffer size for the userspace copy fallback (shutil defaults to 64 KiB-1 MiB)
+_COPY_BUFSIZE = 4 * 1024 * 1024
+
+
+def _dumps_json(data: Dict) -> bytes:
+    """Serialize data to indented JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+
+def _loads_json(raw: bytes) -> Dict:
+    """Deserialize JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode('utf-8'))
+
+
+def _find_manifest(backup_path: Union[str, Path]) -> Optional[str]:
+    """
+    Locate a backup's manifest file, preferring the msgpack form.
+    
+    Args:
+        backup_path: Backup directory
+        
+    Returns:
+        Optional[str]: Manifest path or None if the backup has none
+        
+    Raises:
+        ImportError: If the backup only has a msgpack manifest and msgpack is missing
+    """
+    packed_path = os.path.join(backup_path, _MANIFEST_MSGPACK)
+    if msgpack is not None and os.path.isfile(packed_path):
+        return packed_path
+    
+    json_path = os.path.join(backup_path, _MANIFEST_JSON)
+    if os.path.isfile(json_path):
+        return json_path
+    if os.path.isfile(packed_path):
+        raise ImportError(
+            f"msgpack is required to read the backup manifest {packed_path} "
+            "(pip install -r requirements.txt)"
+        )
+    return None
+
+
+def _load_manifest_data(manifest_path: Union[str, Path]) -> Dict:
+    """Load raw manifest data from a msgpack or JSON manifest file."""
+    with open(manifest_path, 'rb') as f:
+        raw = f.read()
+    if os.path.basename(manifest_path) == _MANIFEST_MSGPACK:
+        return msgpack.unpackb(raw, raw=False)
+    return _loads_json(raw)
+
+
+def _clone_linux(src: Path, dst: Path) -> bool:
+    """Clone src into dst with the FICLONE ioctl (btrfs, XFS, ...)."""
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        try:
+            fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            return True
+        except OSError:
+            return False
+
+
+def _clone_macos(src: Path, dst: Path) -> bool:
+    """
+    Clone src into dst with clonefile(2) on APFS.
+    
+    clonefile refuses to overwrite, so the clone is made next to dst and
+    moved over it, leaving any existing dst intact if cloning fails.
+    """
+    tmp_path = f"{dst}.tmp"
+    try:
+        os.unlink(tmp_path)
+    except FileNotFoundError:
+        pass
+    if _libc.clonefile(os.fsencode(src), os.fsencode(tmp_path), 0) != 0:
+        return False
+    try:
+        os.replace(tmp_path, dst)
+    except OSError:
+        os.unlink(tmp_path)
+        raise
+    return True
+
+
+def _copy_windows(src: Path, dst: Path) -> bool:
+    """Copy src to dst with CopyFileExW (block clone on ReFS)."""
+    import ctypes
+
+    return bool(ctypes.windll.kernel32.CopyFileExW(str(src), str(dst), None, None, None, 0))
+
+
+def _sendfile_copy(src: Path, dst: Path) -> None:
+    """
+    Copy a file with its metadata entirely in kernel space via os.sendfile.
+    
+    Args:
+        src: Source file
+        dst: Destination file
+    """
+    in_fd = os.open(str(src), os.O_RDONLY)
+    try:
+        out_fd = os.open(str(dst), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            offset = 0
+            while True:
+                sent = os.sendfile(out_fd, in_fd, offset, 1 << 30)
+                if sent == 0:
+                    break
+                offset += sent
+        finally:
+            os.close(out_fd)
+    finally:
+        os.close(in_fd)
+    shutil.copystat(src, dst)
+
+
+def _copy_with_bufsize(src: Path, dst: Path, bufsize: int = _COPY_BUFSIZE) -> None:
+    """
+    Copy a file with its metadata using a large userspace buffer.
+    
+    Args:
+        src: Source file
+        dst: Destination file
+        bufsize: Read/write chunk size in bytes
+    """
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        shutil.copyfileobj(fsrc, fdst, bufsize)
+    shutil.copystat(src, dst)
+
+
+def _fast_copy(src: Path, dst: Path, src_stat: Optional[os.stat_result] = None) -> None:
+    """
+    Copy a file with its metadata, cloning it when the filesystem supports it.
+    
+    Copy-on-write clones only touch metadata, so on btrfs/XFS/APFS/ReFS the
+    copy is effectively free. Falls back to sendfile on Linux and to a
+    buffered userspace copy elsewhere.
+    
+    Args:
+        src: Source file
+        dst: Destination file
+        src_stat: Result of os.stat(src) if the caller already has it
+    """
+    if src_stat is None:
+        src_stat = os.stat(src)
+    
+    if src_stat.st_size == 0:
+        open(dst, 'wb').close()
+        shutil.copystat(src, dst)
+        return
+    
+    try:
+        if sys.platform.startswith('linux'):
+            if _clone_linux(src, dst):
+                shutil.copystat(src, dst)
+                return
+            # sendfile only accepts regular file targets on Linux
+            if hasattr(os, 'sendfile'):
+                _sendfile_copy(src, dst)
+                return
+        elif sys.platform == 'darwin':
+            # clonefile carries metadata over itself
+            if _clone_macos(src, dst):
+                return
+        elif sys.platform == 'win32':
+            if _copy_windows(src, dst):
+                return
+    except (OSError, AttributeError):
+        pass
+    
+    _copy_with_bufsize(src, dst)
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class BackupEntry:
     """Represents a single backed up file."""
     original_path: str
@@ -20,7 +228,7 @@ class BackupEntry:
     file_size: int
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class BackupManifest:
     """Manifest of a complete backup operation."""
     backup_id: str
@@ -30,20 +238,68 @@ class BackupManifest:
     description: str
 
 
+def _manifest_to_dict(manifest: BackupManifest) -> Dict:
+    """Convert a manifest to plain data without dataclasses.asdict's deep copies."""
+    return {
+        'backup_id': manifest.backup_id,
+        'timestamp': manifest.timestamp,
+        'steam_path': manifest.steam_path,
+        'files': [
+            {
+                'original_path': entry.original_path,
+                'backup_path': entry.backup_path,
+                'timestamp': entry.timestamp,
+                'file_size': entry.file_size,
+            }
+            for entry in manifest.files
+        ],
+        'description': manifest.description,
+    }
+
+
 class BackupManager:
     """Manages backups of Steam configuration files."""
     
-    def __init__(self, backup_dir: Optional[Path] = None):
+    def __init__(self, backup_dir: Optional[Path] = None, human_readable: bool = False):
         """
         Initialize backup manager.
         
         Args:
             backup_dir: Directory for backups (default: ./backups)
+            human_readable: Also write a JSON manifest next to the msgpack one
         """
         self.backup_dir = backup_dir or Path("backups")
+        self.human_readable = human_readable
         self.backup_dir.mkdir(exist_ok=True)
         self.current_backup_id: Optional[str] = None
         self.current_backup_path: Optional[Path] = None
+        
+        # backup_id -> (manifest mtime_ns, parsed manifest)
+        self._manifest_cache: Dict[str, Tuple[int, BackupManifest]] = {}
+    
+    def _read_manifest(self, backup_id: str,
+                       manifest_path: Union[str, Path]) -> Tuple[int, BackupManifest]:
+        """
+        Read a backup manifest, reusing the cached copy if the file is unchanged.
+        
+        Args:
+            backup_id: Backup ID
+            manifest_path: Path to the backup's manifest file
+            
+        Returns:
+            Tuple[int, BackupManifest]: Manifest mtime_ns and parsed manifest
+        """
+        mtime_ns = os.stat(manifest_path).st_mtime_ns
+        cached = self._manifest_cache.get(backup_id)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached
+        
+        manifest_data = _load_manifest_data(manifest_path)
+        manifest_data['files'] = [BackupEntry(**entry) for entry in manifest_data['files']]
+        manifest = BackupManifest(**manifest_data)
+        
+        self._manifest_cache[backup_id] = (mtime_ns, manifest)
+        return mtime_ns, manifest
     
     def create_backup(self, files: List[Path], description: str = "") -> str:
         """
@@ -62,27 +318,33 @@ class BackupManager:
         backup_path = self.backup_dir / backup_id
         backup_path.mkdir(exist_ok=True)
         
-        # Backup each file
-        backup_entries = []
-        for file_path in files:
-            if not file_path.exists():
-                continue
+        def _copy_one(file_path: Path) -> Optional[BackupEntry]:
+            # One stat per file covers the existence check, size and copy
+            try:
+                st = os.stat(file_path)
+            except FileNotFoundError:
+                return None
             
             # Create backup filename
             backup_filename = file_path.name
             backup_file_path = backup_path / backup_filename
             
             # Copy file
-            shutil.copy2(file_path, backup_file_path)
+            _fast_copy(file_path, backup_file_path, st)
             
             # Create entry
-            entry = BackupEntry(
+            return BackupEntry(
                 original_path=str(file_path),
                 backup_path=str(backup_file_path),
                 timestamp=timestamp,
-                file_size=file_path.stat().st_size
+                file_size=st.st_size
             )
-            backup_entries.append(entry)
+        
+        # Backup each file; copies are independent and I/O-bound
+        backup_entries = []
+        if files:
+            with ThreadPoolExecutor(max_workers=min(_MAX_COPY_WORKERS, len(files))) as executor:
+                backup_entries = [e for e in executor.map(_copy_one, files) if e is not None]
         
         # Create manifest
         manifest = BackupManifest(
@@ -93,10 +355,15 @@ class BackupManager:
             description=description or f"Backup created at {timestamp}"
         )
         
-        # Save manifest
-        manifest_path = backup_path / "manifest.json"
-        with open(manifest_path, 'w', encoding='utf-8') as f:
-            json.dump(asdict(manifest), f, indent=2)
+        # Save manifest; msgpack when available, JSON as the human-readable form
+        manifest_data = _manifest_to_dict(manifest)
+        manifest_path = backup_path / _MANIFEST_JSON
+        if self.human_readable or msgpack is None:
+            manifest_path.write_bytes(_dumps_json(manifest_data))
+        if msgpack is not None:
+            manifest_path = backup_path / _MANIFEST_MSGPACK
+            manifest_path.write_bytes(msgpack.packb(manifest_data, use_bin_type=True))
+        self._manifest_cache[backup_id] = (manifest_path.stat().st_mtime_ns, manifest)
         
         self.current_backup_id = backup_id
         self.current_backup_path = backup_path
@@ -114,22 +381,17 @@ class BackupManager:
             bool: True if successful
         """
         backup_path = self.backup_dir / backup_id
-        manifest_path = backup_path / "manifest.json"
+        manifest_path = _find_manifest(backup_path)
         
-        if not manifest_path.exists():
-            raise FileNotFoundError(f"Backup manifest not found: {manifest_path}")
+        if manifest_path is None:
+            raise FileNotFoundError(f"Backup manifest not found in: {backup_path}")
         
-        # Load manifest
-        with open(manifest_path, 'r', encoding='utf-8') as f:
-            manifest_data = json.load(f)
+        # Load manifest; only two fields per entry are needed, so skip the dataclasses
+        entries = _load_manifest_data(manifest_path)['files']
         
-        manifest = BackupManifest(**manifest_data)
-        
-        # Restore each file
-        for entry_data in manifest.files:
-            entry = BackupEntry(**entry_data)
-            backup_file = Path(entry.backup_path)
-            original_file = Path(entry.original_path)
+        def _restore_one(entry_data: Dict) -> None:
+            backup_file = Path(entry_data['backup_path'])
+            original_file = Path(entry_data['original_path'])
             
             if not backup_file.exists():
                 raise FileNotFoundError(f"Backup file not found: {backup_file}")
@@ -138,7 +400,12 @@ class BackupManager:
             original_file.parent.mkdir(parents=True, exist_ok=True)
             
             # Restore file
-            shutil.copy2(backup_file, original_file)
+            _fast_copy(backup_file, original_file)
+        
+        # Restore each file; consuming the results re-raises worker errors
+        if entries:
+            with ThreadPoolExecutor(max_workers=min(_MAX_COPY_WORKERS, len(entries))) as executor:
+                list(executor.map(_restore_one, entries))
         
         return True
     
@@ -151,19 +418,18 @@ class BackupManager:
         """
         backups = []
         
-        for backup_dir in sorted(self.backup_dir.iterdir(), reverse=True):
-            if not backup_dir.is_dir():
-                continue
-            
-            manifest_path = backup_dir / "manifest.json"
-            if not manifest_path.exists():
+        # scandir's DirEntry answers is_dir() from the directory read, no extra stat
+        with os.scandir(self.backup_dir) as it:
+            entries = [(entry.name, entry.path) for entry in it if entry.is_dir()]
+        entries.sort(reverse=True)
+        
+        for backup_id, backup_dir in entries:
+            manifest_path = _find_manifest(backup_dir)
+            if manifest_path is None:
                 continue
             
             try:
-                with open(manifest_path, 'r', encoding='utf-8') as f:
-                    manifest_data = json.load(f)
-                manifest = BackupManifest(**manifest_data)
-                backups.append(manifest)
+                backups.append(self._read_manifest(backup_id, manifest_path)[1])
             except Exception:
                 continue
         
@@ -179,15 +445,13 @@ class BackupManager:
         Returns:
             Optional[BackupManifest]: Backup manifest or None
         """
-        manifest_path = self.backup_dir / backup_id / "manifest.json"
+        manifest_path = _find_manifest(self.backup_dir / backup_id)
         
-        if not manifest_path.exists():
+        if manifest_path is None:
             return None
         
         try:
-            with open(manifest_path, 'r', encoding='utf-8') as f:
-                manifest_data = json.load(f)
-            return BackupManifest(**manifest_data)
+            return self._read_manifest(backup_id, manifest_path)[1]
         except Exception:
             return None
     
@@ -206,6 +470,8 @@ class BackupManager:
         if not backup_path.exists():
             return False
         
+        self._manifest_cache.pop(backup_id, None)
+        
         try:
             shutil.rmtree(backup_path)
             return True
@@ -3,14 +3,19 @@ Steam Library Fixer - Fixer Module
 Applies fixes to Steam configuration issues.
 """
 
+import os
+from itertools import groupby
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Set
 from .scanner import SteamScanner, GameIssue, OrphanedDownload
 from .vdf_parser import read_manifest, write_manifest, read_library_folders, write_library_folders
 from .backup import BackupManager
 from .logger import get_logger
 import shutil
 
+# Issue types fixed by rewriting a manifest's StagingFolder
+_STAGING_ISSUE_TYPES = ("staging_folder_mismatch", "missing_staging_library")
+
 
 class SteamFixer:
     """Applies fixes to Steam configuration issues."""
@@ -30,6 +35,8 @@ class SteamFixer:
         self.logger = get_logger()
         self.fixed_count = 0
         self.failed_count = 0
+        # Games whose manifest or downloads were changed, for SteamScanner.rescan
+        self.fixed_app_ids: Set[str] = set()
     
     def fix_all(self) -> Dict[str, Any]:
         """
@@ -40,28 +47,42 @@ class SteamFixer:
         """
         self.logger.heading("Fixing Issues")
         
+        dead_libraries = [lib for lib in self.scanner.libraries.values() if not lib.exists]
+        
+        # Nothing to fix: skip the backup entirely
+        if not (self.scanner.issues or self.scanner.orphaned_downloads or dead_libraries):
+            self.logger.info("No issues to fix")
+            return {
+                'fixed': self.fixed_count,
+                'failed': self.failed_count,
+                'dry_run': self.dry_run
+            }
+        
         # Create backup first
         if not self.dry_run:
-            backup_files = self._collect_files_to_backup()
+            backup_files = self._collect_files_to_backup(dead_libraries)
             if backup_files:
-                self.logger.info(f"Creating backup of {len(backup_files)} files...")
+                self.logger.info("Creating backup of %d files...", len(backup_files))
                 backup_id = self.backup_manager.create_backup(
                     backup_files,
                     "Pre-fix backup"
                 )
                 self.logger.success(f"Backup created: {backup_id}")
         
-        # Fix staging folder issues
-        for issue in self.scanner.issues:
-            if issue.issue_type in ["staging_folder_mismatch", "missing_staging_library"]:
-                self._fix_staging_folder(issue)
+        # Fix staging folder issues, reading and writing each manifest once
+        staging_issues = sorted(
+            (issue for issue in self.scanner.issues if issue.issue_type in _STAGING_ISSUE_TYPES),
+            key=lambda issue: str(issue.manifest_path)
+        )
+        for _, group in groupby(staging_issues, key=lambda issue: str(issue.manifest_path)):
+            group = list(group)
+            self._fix_staging_folders(group[0].manifest_path, group)
         
         # Clean orphaned downloads
         for orphaned in self.scanner.orphaned_downloads:
             self._clean_orphaned_download(orphaned)
         
         # Remove dead libraries (optional)
-        dead_libraries = [lib for lib in self.scanner.libraries.values() if not lib.exists]
         if dead_libraries:
             self._remove_dead_libraries(dead_libraries)
         
@@ -71,47 +92,66 @@ class SteamFixer:
             'dry_run': self.dry_run
         }
     
-    def _fix_staging_folder(self, issue: GameIssue) -> bool:
+    def _apply_staging_fix_in_memory(self, manifest_data: Dict[str, Any], issue: GameIssue) -> bool:
         """
-        Fix staging folder mismatch in game manifest.
+        Update StagingFolder for an issue in already-parsed manifest data.
         
         Args:
+            manifest_data: Parsed manifest to modify
             issue: GameIssue to fix
             
+        Returns:
+            bool: True if the manifest had an AppState section to update
+        """
+        if 'AppState' not in manifest_data:
+            return False
+        manifest_data['AppState']['StagingFolder'] = str(issue.expected_value)
+        return True
+    
+    def _fix_staging_folders(self, manifest_path: Path, issues: List[GameIssue]) -> bool:
+        """
+        Fix staging folder mismatches that share one game manifest.
+        
+        Args:
+            manifest_path: Manifest file the issues belong to
+            issues: GameIssues to fix
+            
         Returns:
             bool: True if successful
         """
         try:
-            self.logger.info(f"Fixing {issue.game_name} (App ID: {issue.app_id})")
-            self.logger.debug(f"  Issue: {issue.description}")
-            self.logger.debug(f"  Current: StagingFolder = {issue.current_value}")
-            self.logger.debug(f"  Expected: StagingFolder = {issue.expected_value}")
+            # Read manifest
+            manifest_data = None if self.dry_run else read_manifest(manifest_path)
+            
+            for issue in issues:
+                self.logger.info("Fixing %s (App ID: %s)", issue.game_name, issue.app_id)
+                self.logger.debug("  Issue: %s", issue.description)
+                self.logger.debug("  Current: StagingFolder = %s", issue.current_value)
+                self.logger.debug("  Expected: StagingFolder = %s", issue.expected_value)
+                
+                if self.dry_run:
+                    self.logger.info("  [DRY RUN] Would change StagingFolder from %s to %s",
+                                     issue.current_value, issue.expected_value)
+                elif not self._apply_staging_fix_in_memory(manifest_data, issue):
+                    # Nothing was changed, so don't write the manifest or report it fixed
+                    raise ValueError("No AppState section in manifest")
             
             if self.dry_run:
-                self.logger.info(f"  [DRY RUN] Would change StagingFolder from {issue.current_value} to {issue.expected_value}")
-                self.fixed_count += 1
+                self.fixed_count += len(issues)
                 return True
             
-            # Read manifest
-            manifest_data = read_manifest(issue.manifest_path)
-            
-            # Update staging folder
-            if 'AppState' in manifest_data:
-                manifest_data['AppState']['StagingFolder'] = str(issue.expected_value)
-            
             # Write back
-            if write_manifest(manifest_data, issue.manifest_path):
+            write_manifest(manifest_data, manifest_path)
+            for issue in issues:
                 self.logger.success(f"  Fixed StagingFolder for {issue.game_name}")
-                self.fixed_count += 1
-                return True
-            else:
-                self.logger.error(f"  Failed to write manifest for {issue.game_name}")
-                self.failed_count += 1
-                return False
+                self.fixed_app_ids.add(issue.app_id)
+            self.fixed_count += len(issues)
+            return True
                 
         except Exception as e:
-            self.logger.error(f"  Error fixing {issue.game_name}: {e}")
-            self.failed_count += 1
+            for issue in issues:
+                self.logger.error("  Error fixing %s: %s", issue.game_name, e)
+            self.failed_count += len(issues)
             return False
     
     def _clean_orphaned_download(self, orphaned: OrphanedDownload) -> bool:
@@ -126,37 +166,53 @@ class SteamFixer:
         """
         try:
             game_name = self.scanner.games.get(orphaned.app_id, {}).get('name', 'Unknown')
-            file_count = len(orphaned.files)
+            file_count = orphaned.file_count
             size_mb = orphaned.total_size / (1024 * 1024)
             
-            self.logger.info(f"Cleaning orphaned downloads for {game_name} (App ID: {orphaned.app_id})")
-            self.logger.debug(f"  Location: {orphaned.library_path}")
-            self.logger.debug(f"  Files: {file_count}, Size: {size_mb:.2f} MB")
+            self.logger.info("Cleaning orphaned downloads for %s (App ID: %s)",
+                             game_name, orphaned.app_id)
+            self.logger.debug("  Location: %s", orphaned.library_path)
+            self.logger.debug("  Files: %d, Size: %.2f MB", file_count, size_mb)
             
             if self.dry_run:
-                self.logger.info(f"  [DRY RUN] Would delete {file_count} orphaned files ({size_mb:.2f} MB)")
+                self.logger.info("  [DRY RUN] Would delete %d orphaned files (%.2f MB)",
+                                 file_count, size_mb)
                 self.fixed_count += 1
                 return True
             
             # Delete files
-            for file_path in orphaned.files:
-                try:
-                    if file_path.is_file():
-                        file_path.unlink()
-                    elif file_path.is_dir():
-                        shutil.rmtree(file_path)
-                except Exception as e:
-                    self.logger.warning(f"  Failed to delete {file_path.name}: {e}")
+            self._delete_orphaned_files(orphaned)
             
             self.logger.success(f"  Cleaned {file_count} orphaned files")
+            self.fixed_app_ids.add(orphaned.app_id)
             self.fixed_count += 1
             return True
             
         except Exception as e:
-            self.logger.error(f"  Error cleaning orphaned downloads: {e}")
+            self.logger.error("  Error cleaning orphaned downloads: %s", e)
             self.failed_count += 1
             return False
     
+    def _delete_orphaned_files(self, orphaned: OrphanedDownload):
+        """
+        Delete an orphaned download.
+        
+        Everything under an orphaned app folder belongs to the orphan, so it is
+        removed with a single rmtree.
+        
+        Args:
+            orphaned: OrphanedDownload to delete
+        """
+        try:
+            if orphaned.is_dir:
+                shutil.rmtree(orphaned.path)
+            else:
+                os.unlink(orphaned.path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            self.logger.warning("  Failed to delete %s: %s", os.path.basename(orphaned.path), e)
+    
     def _remove_dead_libraries(self, dead_libraries: List) -> bool:
         """
         Remove non-existent libraries from Steam configuration.
@@ -171,13 +227,13 @@ class SteamFixer:
             return True
         
         try:
-            self.logger.info(f"Removing {len(dead_libraries)} dead library entries")
+            self.logger.info("Removing %d dead library entries", len(dead_libraries))
             
             for lib in dead_libraries:
-                self.logger.debug(f"  Library {lib.library_id}: {lib.path}")
+                self.logger.debug("  Library %s: %s", lib.library_id, lib.path)
             
             if self.dry_run:
-                self.logger.info(f"  [DRY RUN] Would remove {len(dead_libraries)} library entries")
+                self.logger.info("  [DRY RUN] Would remove %d library entries", len(dead_libraries))
                 self.fixed_count += 1
                 return True
             
@@ -191,36 +247,31 @@ class SteamFixer:
                         del library_data['libraryfolders'][lib.library_id]
             
             # Write back
-            if write_library_folders(library_data, self.scanner.library_vdf_path):
-                self.logger.success(f"  Removed {len(dead_libraries)} dead library entries")
-                self.fixed_count += 1
-                return True
-            else:
-                self.logger.error("  Failed to write library configuration")
-                self.failed_count += 1
-                return False
+            write_library_folders(library_data, self.scanner.library_vdf_path)
+            self.logger.success(f"  Removed {len(dead_libraries)} dead library entries")
+            self.fixed_count += 1
+            return True
                 
         except Exception as e:
-            self.logger.error(f"  Error removing dead libraries: {e}")
+            self.logger.error("  Error removing dead libraries: %s", e)
             self.failed_count += 1
             return False
     
-    def _collect_files_to_backup(self) -> List[Path]:
+    def _collect_files_to_backup(self, dead_libraries: List) -> List[Path]:
         """
         Collect all files that will be modified.
         
+        Args:
+            dead_libraries: List of LibraryInfo objects that don't exist
+            
         Returns:
             List[Path]: Files to backup
         """
-        files = set()
+        # Manifest files for games with issues
+        files = frozenset(issue.manifest_path for issue in self.scanner.issues)
         
         # Add library config if we're removing dead libraries
-        dead_libraries = [lib for lib in self.scanner.libraries.values() if not lib.exists]
         if dead_libraries:
-            files.add(self.scanner.library_vdf_path)
-        
-        # Add manifest files for games with issues
-        for issue in self.scanner.issues:
-            files.add(issue.manifest_path)
+            files = files | {self.scanner.library_vdf_path}
         
         return list(files)
@@ -10,6 +10,11 @@ from datetime import datetime
 from typing import Optional
 from rich.console import Console
 from rich.logging import RichHandler
+from rich.text import Text
+
+
+# Markup parsed once; messages are appended as plain Text so they aren't re-parsed
+_SUCCESS_PREFIX = Text.from_markup("[green]✓[/green] ")
 
 
 class SteamFixerLogger:
@@ -19,13 +24,17 @@ class SteamFixerLogger:
         """
         Initialize logger with file and console handlers.
         
+        The log directory, log file and console are only created on first use,
+        so runs that never log don't touch the filesystem.
+        
         Args:
             log_dir: Directory for log files (default: ./logs)
             verbose: Enable verbose/debug logging
         """
-        self.console = Console()
+        self._console: Optional[Console] = None
+        self._handlers_attached = False
+        self.verbose = verbose
         self.log_dir = log_dir or Path("logs")
-        self.log_dir.mkdir(exist_ok=True)
         
         # Create logger
         self.logger = logging.getLogger("SteamLibraryFixer")
@@ -34,10 +43,26 @@ class SteamFixerLogger:
         # Remove existing handlers
         self.logger.handlers.clear()
         
-        # File handler - always detailed
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        log_file = self.log_dir / f"steam_fixer_{timestamp}.log"
-        file_handler = logging.FileHandler(log_file, encoding='utf-8')
+        self.log_file_path = self.log_dir / f"steam_fixer_{timestamp}.log"
+    
+    @property
+    def console(self) -> Console:
+        """Rich console, created on first use."""
+        if self._console is None:
+            self._console = Console()
+        return self._console
+    
+    def _ensure_handlers(self):
+        """Attach the file and console handlers before the first record is logged."""
+        if self._handlers_attached:
+            return
+        self._handlers_attached = True
+        
+        self.log_dir.mkdir(exist_ok=True)
+        
+        # File handler - always detailed
+        file_handler = logging.FileHandler(self.log_file_path, encoding='utf-8')
         file_handler.setLevel(logging.DEBUG)
         file_formatter = logging.Formatter(
             '%(asctime)s | %(levelname)-8s | %(message)s',
@@ -53,37 +78,42 @@ class SteamFixerLogger:
             show_path=False,
             markup=True
         )
-        console_handler.setLevel(logging.DEBUG if verbose else logging.INFO)
+        console_handler.setLevel(logging.DEBUG if self.verbose else logging.INFO)
         self.logger.addHandler(console_handler)
         
-        self.log_file_path = log_file
-        self.logger.info(f"Logging to: {log_file}")
+        self.logger.info("Logging to: %s", self.log_file_path)
     
-    def info(self, message: str):
-        """Log info message."""
-        self.logger.info(message)
+    def info(self, message: str, *args):
+        """Log info message; args are %-formatted only if the record is emitted."""
+        self._ensure_handlers()
+        self.logger.info(message, *args)
     
-    def warning(self, message: str):
+    def warning(self, message: str, *args):
         """Log warning message."""
-        self.logger.warning(message)
+        self._ensure_handlers()
+        self.logger.warning(message, *args)
     
-    def error(self, message: str):
+    def error(self, message: str, *args):
         """Log error message."""
-        self.logger.error(message)
+        self._ensure_handlers()
+        self.logger.error(message, *args)
     
-    def debug(self, message: str):
+    def debug(self, message: str, *args):
         """Log debug message."""
-        self.logger.debug(message)
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+        self._ensure_handlers()
+        self.logger.debug(message, *args)
     
     def success(self, message: str):
         """Log success message with green color."""
-        self.console.print(f"[green]✓[/green] {message}")
-        self.logger.info(f"SUCCESS: {message}")
+        self.console.print(_SUCCESS_PREFIX + Text(message))
+        self.info("SUCCESS: %s", message)
     
     def heading(self, message: str):
         """Print a heading/section title."""
-        self.console.print(f"\n[bold cyan]{message}[/bold cyan]")
-        self.logger.info(f"=== {message} ===")
+        self.console.print(Text.assemble("\n", (message, "bold cyan")))
+        self.info("=== %s ===", message)
     
     def separator(self):
         """Print a separator line."""
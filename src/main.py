@@ -10,7 +10,6 @@ from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich.prompt import Prompt, Confirm
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from .scanner import SteamScanner
 from .fixer import SteamFixer
@@ -103,10 +102,24 @@ def display_scan_results(scanner: SteamScanner):
         
         for orphaned in scanner.orphaned_downloads:
             game_name = scanner.games.get(orphaned.app_id, {}).get('name', 'Unknown')
-            console.print(f"  • {game_name} - {len(orphaned.files)} files ({format_bytes(orphaned.total_size)})")
+            console.print(f"  • {game_name} - {orphaned.file_count} files "
+                          f"({format_bytes(orphaned.total_size)})")
 
 
-def interactive_mode(steam_path: Path):
+def print_remaining_issues(scanner: SteamScanner, fixer: SteamFixer):
+    """Re-scan the games that were just fixed and report what is left."""
+    try:
+        scanner.rescan(app_ids=fixer.fixed_app_ids)
+    except Exception as e:
+        console.print(f"[yellow]Could not verify fixes: {e}[/yellow]")
+        return
+    
+    summary = scanner.get_summary()
+    console.print(f"  Remaining issues: {summary['total_issues']}, "
+                  f"orphaned downloads: {summary['orphaned_downloads']}")
+
+
+def interactive_mode(steam_path: Path, human_readable: bool = False):
     """Run in interactive mode with menu."""
     logger = get_logger(verbose=False)
     
@@ -128,15 +141,10 @@ def interactive_mode(steam_path: Path):
     
     scanner = SteamScanner(steam_path)
     
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console
-    ) as progress:
-        task = progress.add_task("Scanning...", total=None)
+    # A status spinner is lighter than a full Progress for an indeterminate task
+    with console.status("Scanning...", refresh_per_second=4):
         try:
             scanner.scan()
-            progress.update(task, completed=True)
         except Exception as e:
             console.print(f"[red]Scan failed: {e}[/red]")
             return 1
@@ -176,7 +184,7 @@ def interactive_mode(steam_path: Path):
     
     # Apply fixes
     dry_run = (choice == "3")
-    backup_manager = BackupManager()
+    backup_manager = BackupManager(human_readable=human_readable)
     fixer = SteamFixer(scanner, backup_manager, dry_run=dry_run)
     
     if not dry_run:
@@ -195,6 +203,7 @@ def interactive_mode(steam_path: Path):
     if results['dry_run']:
         console.print("\n[yellow]This was a dry run. No changes were made.[/yellow]")
     else:
+        print_remaining_issues(scanner, fixer)
         console.print("\n[green]✓ Fixes applied successfully![/green]")
         console.print("You can now restart Steam.")
     
@@ -209,8 +218,9 @@ def interactive_mode(steam_path: Path):
 @click.option('--dry-run', is_flag=True, help='Show what would be fixed without making changes')
 @click.option('--restore', type=str, help='Restore from backup (provide backup ID)')
 @click.option('--list-backups', is_flag=True, help='List available backups')
+@click.option('--human-readable', is_flag=True, help='Also write backup manifests as JSON')
 @click.option('--verbose', is_flag=True, help='Enable verbose logging')
-def main(steam_path, scan, fix_all, dry_run, restore, list_backups, verbose):
+def main(steam_path, scan, fix_all, dry_run, restore, list_backups, human_readable, verbose):
     """
     Steam Library Fixer - Automatic Steam configuration repair tool.
     
@@ -283,15 +293,17 @@ def main(steam_path, scan, fix_all, dry_run, restore, list_backups, verbose):
             return 0
         
         # Fix issues
-        backup_manager = BackupManager()
+        backup_manager = BackupManager(human_readable=human_readable)
         fixer = SteamFixer(scanner, backup_manager, dry_run=dry_run)
         results = fixer.fix_all()
         
         console.print(f"\nFixed: {results['fixed']}, Failed: {results['failed']}")
+        if not dry_run:
+            print_remaining_issues(scanner, fixer)
         return 0 if results['failed'] == 0 else 1
     else:
         # Interactive mode
-        return interactive_mode(steam_path)
+        return interactive_mode(steam_path, human_readable)
 
 
 if __name__ == '__main__':
@@ -3,14 +3,159 @@ Steam Library Fixer - Scanner Module
 Scans Steam installation for issues and misconfigurations.
 """
 
+import os
+import pickle
+import stat
+import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Dict, Optional, Any
-from .vdf_parser import VDFParser, read_manifest, read_library_folders
-from .utils import safe_path, get_app_name_from_manifest, get_app_id_from_filename
+from typing import List, Dict, Optional, Any, Tuple, Set, Iterator
+from .vdf_parser import VDFParser, read_manifest, read_manifest_header, read_library_folders
+from .utils import (
+    safe_path,
+    get_app_name_from_manifest,
+    get_app_id_from_filename,
+    get_app_id_from_download_filename,
+    get_cache_dir,
+    DATACLASS_SLOTS
+)
 
 
-@dataclass
+# Parsed manifests cached between runs, keyed on (path, mtime_ns, size)
+SCAN_CACHE_FILE = "scan.bin"
+_SCAN_CACHE_MAX_ENTRIES = 2000
+
+# Bump whenever manifest parsing or the cached game info/download size shape
+# changes, so entries written by an older build are not served as current
+_SCAN_CACHE_FORMAT = 3
+
+# Manifest parsing is I/O-bound per file; threads overlap the reads
+_MAX_SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Threads used to size orphaned download trees
+_MAX_ORPHAN_WORKERS = 16
+
+# os.fwalk and dir_fd-relative stat are POSIX-only
+_HAVE_FWALK = hasattr(os, 'fwalk') and os.stat in os.supports_dir_fd
+
+# Shared strings for every issue record and the severity index keys
+_SEVERITY = {s: sys.intern(s) for s in ('critical', 'warning', 'info')}
+_ISSUE_TYPES = {t: sys.intern(t) for t in ('missing_staging_library', 'staging_folder_mismatch')}
+
+
+def _iter_tree(root: str) -> Iterator[os.DirEntry]:
+    """
+    Recursively yield every entry (files and directories) under a directory.
+    
+    Unreadable subdirectories are skipped; only errors opening root propagate.
+    
+    Args:
+        root: Directory to walk
+        
+    Yields:
+        os.DirEntry: Entries below root, parents before their children
+    """
+    stack = [root]
+    while stack:
+        path = stack.pop()
+        try:
+            it = os.scandir(path)
+        except OSError:
+            if path is root:
+                raise
+            continue
+        with it:
+            for entry in it:
+                yield entry
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+
+
+def _tree_size(root: str) -> Tuple[int, int]:
+    """
+    Count the files in a directory tree and total their sizes in one pass.
+    
+    Like Path.rglob, unreadable subdirectories and files are skipped; only
+    errors opening root propagate.
+    
+    Args:
+        root: Directory to walk
+        
+    Returns:
+        Tuple[int, int]: File count and total file size
+    """
+    file_count = 0
+    total_size = 0
+    
+    if _HAVE_FWALK:
+        # fstatat relative to each open directory skips re-resolving the full path
+        for _, _, filenames, dir_fd in os.fwalk(root):
+            for name in filenames:
+                try:
+                    st = os.stat(name, dir_fd=dir_fd, follow_symlinks=False)
+                except OSError:
+                    continue
+                if stat.S_ISREG(st.st_mode):
+                    file_count += 1
+                    total_size += st.st_size
+        return file_count, total_size
+    
+    for entry in _iter_tree(root):
+        if entry.is_file(follow_symlinks=False):
+            try:
+                total_size += entry.stat(follow_symlinks=False).st_size
+            except OSError:
+                continue
+            file_count += 1
+    return file_count, total_size
+
+
+def _game_info(app_id: str, manifest_path: str, manifest: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Build scanner game info from parsed manifest data.
+    
+    Args:
+        app_id: App ID from the manifest filename
+        manifest_path: Path to appmanifest_*.acf
+        manifest: Parsed (possibly header-only) manifest data
+        
+    Returns:
+        Dict: Game info
+    """
+    app_state = manifest.get('AppState', {})
+    
+    return {
+        'app_id': app_id,
+        'name': app_state.get('name', 'Unknown'),
+        'manifest_path': Path(manifest_path),
+        'install_dir': app_state.get('installdir', ''),
+        'staging_folder': app_state.get('StagingFolder'),
+        'size_on_disk': app_state.get('SizeOnDisk', 0)
+    }
+
+
+def _parse_one(app_id: str, manifest_path: str) -> Dict[str, Any]:
+    """
+    Parse a single game manifest into scanner game info.
+    
+    Args:
+        app_id: App ID from the manifest filename
+        manifest_path: Path to appmanifest_*.acf
+        
+    Returns:
+        Dict: Game info
+    """
+    # Only the fields in _game_info are kept; the fixer re-reads manifests it modifies,
+    # so the full VDF is parsed only when the header doesn't settle them
+    manifest = read_manifest_header(manifest_path)
+    if manifest is None:
+        manifest = read_manifest(manifest_path)
+    return _game_info(app_id, manifest_path, manifest)
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class LibraryInfo:
     """Information about a Steam library folder."""
     library_id: str
@@ -19,7 +164,7 @@ class LibraryInfo:
     apps: Dict[str, int]  # app_id -> size
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class GameIssue:
     """Represents an issue found with a game installation."""
     app_id: str
@@ -32,33 +177,95 @@ class GameIssue:
     severity: str  # "critical", "warning", "info"
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class OrphanedDownload:
     """Represents orphaned download files."""
     library_path: Path
     app_id: str
-    files: List[Path]
+    path: str  # app folder or depot/state file in steamapps/downloading
+    is_dir: bool
+    file_count: int
     total_size: int
+    
+    def iter_files(self) -> Iterator[str]:
+        """
+        Walk the orphaned download on demand.
+        
+        Yields:
+            str: Paths of all entries (files and directories) to delete
+        """
+        if not self.is_dir:
+            yield self.path
+            return
+        for entry in _iter_tree(self.path):
+            yield entry.path
+
+
+def _size_tree(candidate: Tuple[Path, str, str, bool]) -> Optional[OrphanedDownload]:
+    """
+    Size an orphaned download candidate.
+    
+    Args:
+        candidate: (library path, app_id, entry path, is_dir)
+        
+    Returns:
+        Optional[OrphanedDownload]: Orphaned download, or None if it vanished or
+        can't be read
+    """
+    library_path, app_id, path, is_dir = candidate
+    try:
+        if is_dir:
+            file_count, total_size = _tree_size(path)
+        else:
+            file_count, total_size = 1, os.stat(path).st_size
+    except OSError:
+        # One unreadable download must not abort the whole scan
+        return None
+    
+    return OrphanedDownload(
+        library_path=library_path,
+        app_id=app_id,
+        path=path,
+        is_dir=is_dir,
+        file_count=file_count,
+        total_size=total_size
+    )
 
 
 class SteamScanner:
     """Scans Steam installation for configuration issues."""
     
-    def __init__(self, steam_path: Path):
+    def __init__(self, steam_path: Path, cache_dir: Optional[Path] = None, use_cache: bool = True):
         """
         Initialize scanner with Steam installation path.
         
         Args:
             steam_path: Path to Steam directory
+            cache_dir: Directory for the scan cache (default: user cache directory)
+            use_cache: Reuse parsed manifests from previous scans
         """
         self.steam_path = steam_path
         self.steamapps_path = steam_path / "steamapps"
         self.library_vdf_path = self.steamapps_path / "libraryfolders.vdf"
+        self.cache_path = (cache_dir or get_cache_dir()) / SCAN_CACHE_FILE if use_cache else None
         
         self.libraries: Dict[str, LibraryInfo] = {}
         self.games: Dict[str, Dict[str, Any]] = {}
         self.issues: List[GameIssue] = []
         self.orphaned_downloads: List[OrphanedDownload] = []
+        
+        # Severity index and orphan size total, maintained by _add_issue/_add_orphan
+        self._issues_by_severity: Dict[str, List[GameIssue]] = defaultdict(list)
+        self._orphaned_total_size = 0
+        
+        # (manifest path, mtime_ns, size) -> game_info, oldest first
+        self._manifest_cache: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
+        
+        # downloading path -> (mtime_ns, download entries, sizes of orphaned entries)
+        # downloading path -> (mtime_ns, entries, {entry path: (mtime_ns, file_count, total_size)})
+        self._downloads_cache: Dict[
+            str, Tuple[int, List[Tuple[str, str, bool]], Dict[str, Tuple[int, int, int]]]
+        ] = {}
     
     def scan(self) -> bool:
         """
@@ -68,14 +275,82 @@ class SteamScanner:
             bool: True if scan completed successfully
         """
         try:
+            self._load_cache()
             self._scan_libraries()
             self._scan_manifests()
             self._detect_issues()
             self._scan_orphaned_downloads()
+            self._save_cache()
             return True
         except Exception as e:
             raise RuntimeError(f"Scan failed: {e}")
     
+    def rescan(self, library_ids: Optional[Set[str]] = None,
+               app_ids: Optional[Set[str]] = None) -> bool:
+        """
+        Re-scan only part of the Steam installation, e.g. after fixing some games.
+        
+        Library configuration is always re-read. Manifests and issues are refreshed
+        for app_ids, and orphaned downloads for app_ids within library_ids; None
+        means no restriction.
+        
+        Args:
+            library_ids: Libraries whose downloads to re-scan
+            app_ids: Games whose manifests, issues and downloads to re-scan
+            
+        Returns:
+            bool: True if scan completed successfully
+        """
+        try:
+            self.libraries.clear()
+            self._scan_libraries()
+            self._scan_manifests(app_ids)
+            self._detect_issues(app_ids)
+            self._scan_orphaned_downloads(library_ids, app_ids)
+            self._save_cache()
+            return True
+        except Exception as e:
+            raise RuntimeError(f"Scan failed: {e}")
+    
+    def _load_cache(self):
+        """Load the scan cache; a missing, stale or unreadable cache is ignored."""
+        if self.cache_path is None:
+            return
+        
+        try:
+            with open(self.cache_path, 'rb') as f:
+                cache = pickle.load(f)
+        except Exception:
+            return
+        
+        if isinstance(cache, dict) and cache.get('format') == _SCAN_CACHE_FORMAT:
+            self._manifest_cache = cache.get('manifests', {})
+            self._downloads_cache = cache.get('downloads', {})
+    
+    def _save_cache(self):
+        """Persist the scan cache atomically; failures only cost the next scan time."""
+        if self.cache_path is None:
+            return
+        
+        # Evict oldest entries beyond the cap
+        excess = len(self._manifest_cache) - _SCAN_CACHE_MAX_ENTRIES
+        for key in list(self._manifest_cache)[:max(excess, 0)]:
+            del self._manifest_cache[key]
+        
+        cache = {
+            'format': _SCAN_CACHE_FORMAT,
+            'manifests': self._manifest_cache,
+            'downloads': self._downloads_cache
+        }
+        tmp_path = self.cache_path.with_name(self.cache_path.name + '.tmp')
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.cache_path)
+        except OSError:
+            pass
+    
     def _scan_libraries(self):
         """Scan and catalog all Steam library folders."""
         if not self.library_vdf_path.exists():
@@ -95,116 +370,267 @@ class SteamScanner:
                 )
                 self.libraries[lib_id] = lib_info
     
-    def _scan_manifests(self):
-        """Scan all game manifest files in the main Steam library."""
-        manifest_files = self.steamapps_path.glob("appmanifest_*.acf")
+    def _iter_manifests(
+        self, only_app_ids: Optional[Set[str]] = None
+    ) -> Iterator[Tuple[str, str, os.stat_result]]:
+        """
+        Find game manifests in the main Steam library.
         
-        for manifest_path in manifest_files:
-            try:
-                app_id = get_app_id_from_filename(manifest_path.name)
-                if not app_id:
+        Args:
+            only_app_ids: Restrict to these app IDs instead of listing steamapps
+            
+        Yields:
+            Tuple[str, str, os.stat_result]: (app_id, manifest path, stat result)
+        """
+        if only_app_ids is not None:
+            for app_id in only_app_ids:
+                manifest_path = os.path.join(self.steamapps_path, f"appmanifest_{app_id}.acf")
+                try:
+                    yield app_id, manifest_path, os.stat(manifest_path)
+                except OSError:
                     continue
-                
-                manifest_data = read_manifest(manifest_path)
-                app_state = manifest_data.get('AppState', {})
-                
-                game_info = {
-                    'app_id': app_id,
-                    'name': app_state.get('name', 'Unknown'),
-                    'manifest_path': manifest_path,
-                    'install_dir': app_state.get('installdir', ''),
-                    'staging_folder': app_state.get('StagingFolder'),
-                    'size_on_disk': app_state.get('SizeOnDisk', 0),
-                    'manifest_data': manifest_data
-                }
-                
+            return
+        
+        # scandir yields names without building a Path per steamapps entry
+        with os.scandir(self.steamapps_path) as it:
+            for entry in it:
+                app_id = get_app_id_from_filename(entry.name)
+                if not app_id or not entry.is_file(follow_symlinks=False):
+                    continue
+                try:
+                    yield app_id, entry.path, entry.stat()
+                except OSError:
+                    continue
+    
+    def _scan_manifests(self, only_app_ids: Optional[Set[str]] = None):
+        """
+        Scan game manifest files in the main Steam library.
+        
+        Args:
+            only_app_ids: Only (re-)scan these games; games whose manifest is gone are dropped
+        """
+        if only_app_ids is None:
+            self.games.clear()
+        else:
+            for app_id in only_app_ids:
+                self.games.pop(app_id, None)
+        
+        # (app_id, manifest path, cache key) for manifests that need parsing
+        to_parse = []
+        
+        for app_id, manifest_path, st in self._iter_manifests(only_app_ids):
+            key = (manifest_path, st.st_mtime_ns, st.st_size)
+            
+            # Unchanged since the last scan: reuse the parsed manifest
+            game_info = self._manifest_cache.pop(key, None)
+            if game_info is not None:
+                self._manifest_cache[key] = game_info
                 self.games[app_id] = game_info
-                
+                continue
+            
+            to_parse.append((app_id, manifest_path, key))
+        
+        if not to_parse:
+            return
+        
+        with ThreadPoolExecutor(max_workers=min(_MAX_SCAN_WORKERS, len(to_parse))) as executor:
+            futures = [executor.submit(_parse_one, app_id, path) for app_id, path, _ in to_parse]
+        
+        for (app_id, manifest_path, key), future in zip(to_parse, futures):
+            try:
+                game_info = future.result()
             except Exception as e:
                 # Log but don't fail on individual manifest errors
-                print(f"Warning: Failed to parse {manifest_path.name}: {e}")
+                print(f"Warning: Failed to parse {os.path.basename(manifest_path)}: {e}")
+                continue
+            
+            self.games[app_id] = game_info
+            self._manifest_cache[key] = game_info
     
-    def _detect_issues(self):
-        """Detect configuration issues with installed games."""
+    def _detect_issues(self, app_ids: Optional[Set[str]] = None):
+        """
+        Detect configuration issues with installed games.
+        
+        Args:
+            app_ids: Only (re-)check these games, replacing their previous issues
+        """
+        self.issues = [issue for issue in self.issues
+                       if app_ids is not None and issue.app_id not in app_ids]
+        self._issues_by_severity.clear()
+        for issue in self.issues:
+            self._issues_by_severity[issue.severity].append(issue)
+        
+        existing_lib_ids = {lib_id for lib_id, lib_info in self.libraries.items()
+                            if lib_info.exists}
+        
         for app_id, game_info in self.games.items():
+            if app_ids is not None and app_id not in app_ids:
+                continue
+            
             staging_folder = game_info.get('staging_folder')
+            # The VDF parser turns numeric values into ints; library IDs are strings
+            target_library = str(staging_folder) if staging_folder is not None else None
             
             # Issue 1: Staging folder mismatch
-            if staging_folder is not None and staging_folder != '0':
-                # Game is in library 0 but staging folder points elsewhere
-                target_library = str(staging_folder)
-                
-                if target_library in self.libraries:
-                    target_lib_info = self.libraries[target_library]
-                    
-                    # Critical if target library doesn't exist
-                    if not target_lib_info.exists:
-                        self.issues.append(GameIssue(
-                            app_id=app_id,
-                            game_name=game_info['name'],
-                            manifest_path=game_info['manifest_path'],
-                            issue_type="missing_staging_library",
-                            description=f"Update downloads point to non-existent library at {target_lib_info.path}",
-                            current_value=staging_folder,
-                            expected_value='0',
-                            severity="critical"
-                        ))
-                    else:
-                        # Warning if staging folder differs from install location
-                        self.issues.append(GameIssue(
-                            app_id=app_id,
-                            game_name=game_info['name'],
-                            manifest_path=game_info['manifest_path'],
-                            issue_type="staging_folder_mismatch",
-                            description=f"Game installed in library 0 but updates download to library {staging_folder}",
-                            current_value=staging_folder,
-                            expected_value='0',
-                            severity="warning"
-                        ))
-    
-    def _scan_orphaned_downloads(self):
-        """Scan for orphaned download files in all libraries."""
+            # Game is in library 0 but staging folder points to another known library
+            if not target_library or target_library == '0' or target_library not in self.libraries:
+                continue
+            
+            if target_library not in existing_lib_ids:
+                # Critical if target library doesn't exist
+                self._add_issue(GameIssue(
+                    app_id=app_id,
+                    game_name=game_info['name'],
+                    manifest_path=game_info['manifest_path'],
+                    issue_type=_ISSUE_TYPES['missing_staging_library'],
+                    description=("Update downloads point to non-existent library at "
+                                 f"{self.libraries[target_library].path}"),
+                    current_value=staging_folder,
+                    expected_value='0',
+                    severity=_SEVERITY['critical']
+                ))
+            else:
+                # Warning if staging folder differs from install location
+                self._add_issue(GameIssue(
+                    app_id=app_id,
+                    game_name=game_info['name'],
+                    manifest_path=game_info['manifest_path'],
+                    issue_type=_ISSUE_TYPES['staging_folder_mismatch'],
+                    description=("Game installed in library 0 but updates download to library "
+                                 f"{staging_folder}"),
+                    current_value=staging_folder,
+                    expected_value='0',
+                    severity=_SEVERITY['warning']
+                ))
+    
+    def _scan_orphaned_downloads(self, library_ids: Optional[Set[str]] = None,
+                                 app_ids: Optional[Set[str]] = None):
+        """
+        Scan for orphaned download files in all libraries.
+        
+        Args:
+            library_ids: Only (re-)scan these libraries
+            app_ids: Only (re-)scan downloads of these games
+        """
+        # Drop previous results for the scope being re-scanned
+        scoped_paths = (None if library_ids is None else
+                        {lib.path for lib_id, lib in self.libraries.items()
+                         if lib_id in library_ids})
+        self.orphaned_downloads = [
+            od for od in self.orphaned_downloads
+            if not ((scoped_paths is None or od.library_path in scoped_paths)
+                    and (app_ids is None or od.app_id in app_ids))
+        ]
+        self._orphaned_total_size = sum(od.total_size for od in self.orphaned_downloads)
+        
+        # Only games still installed can have orphans
+        wanted_apps = self.games.keys() if app_ids is None else app_ids & self.games.keys()
+        
+        # (library path, app_id, entry path, is_dir) for every orphan candidate
+        candidates = []
+        # Orphans sized by an earlier scan whose entry is unchanged
+        cached_orphans = {}
+        # Entry path -> its own mtime, which the cached size is keyed on
+        entry_mtimes = {}
+        
         for lib_id, lib_info in self.libraries.items():
-            if not lib_info.exists:
+            # Downloads in the main library belong to games installed there
+            if not lib_info.exists or lib_id == '0':
+                continue
+            if library_ids is not None and lib_id not in library_ids:
                 continue
             
-            downloading_path = lib_info.path / "steamapps" / "downloading"
-            if not downloading_path.exists():
+            downloading_path = str(lib_info.path / "steamapps" / "downloading")
+            try:
+                mtime_ns = os.stat(downloading_path).st_mtime_ns
+            except OSError:
+                self._downloads_cache.pop(downloading_path, None)
                 continue
             
-            # Check for app-specific folders and files
-            for item in downloading_path.iterdir():
-                if item.is_dir():
+            # A folder's mtime changes whenever an entry is added or removed in it
+            cached = self._downloads_cache.get(downloading_path)
+            if cached is not None and cached[0] == mtime_ns:
+                entries, sizes = cached[1], cached[2]
+            else:
+                entries = self._list_downloads(downloading_path)
+                sizes = {}
+                self._downloads_cache[downloading_path] = (mtime_ns, entries, sizes)
+            
+            for app_id, path, is_dir in entries:
+                # Game is in main library but has downloads here
+                if app_id not in wanted_apps:
+                    continue
+                # Writes inside an entry don't touch the downloading folder's mtime
+                try:
+                    entry_mtimes[path] = os.stat(path).st_mtime_ns
+                except OSError:
+                    continue
+                cached_size = sizes.get(path)
+                if cached_size is not None and cached_size[0] == entry_mtimes[path]:
+                    cached_orphans[path] = cached_size[1:]
+                candidates.append((lib_info.path, app_id, path, is_dir))
+        
+        if not candidates:
+            return
+        
+        to_size = [c for c in candidates if c[2] not in cached_orphans]
+        
+        # Subtrees are independent; size them concurrently
+        sized = {}
+        if to_size:
+            with ThreadPoolExecutor(max_workers=_MAX_ORPHAN_WORKERS) as executor:
+                for candidate, orphaned in zip(to_size, executor.map(_size_tree, to_size)):
+                    sized[candidate[2]] = orphaned
+        
+        for library_path, app_id, path, is_dir in candidates:
+            if path in cached_orphans:
+                file_count, total_size = cached_orphans[path]
+                orphaned = OrphanedDownload(library_path, app_id, path, is_dir,
+                                            file_count, total_size)
+            else:
+                orphaned = sized[path]
+                if orphaned is None:
+                    continue
+                sizes = self._downloads_cache[os.path.dirname(path)][2]
+                sizes[path] = (entry_mtimes[path], orphaned.file_count, orphaned.total_size)
+            self._add_orphan(orphaned)
+    
+    @staticmethod
+    def _list_downloads(downloading_path: str) -> List[Tuple[str, str, bool]]:
+        """
+        List the per-app entries of a library's downloading folder.
+        
+        Args:
+            downloading_path: Path to steamapps/downloading
+            
+        Returns:
+            List[Tuple[str, str, bool]]: (app_id, entry path, is_dir) for app folders
+            and depot/state files
+        """
+        entries = []
+        with os.scandir(downloading_path) as it:
+            for entry in it:
+                if entry.is_dir():
                     # Directory named after app_id
-                    app_id = item.name
-                    if app_id.isdigit():
-                        # Check if this game is actually installed in this library
-                        if app_id in self.games and lib_id != '0':
-                            # Game is in main library but has downloads here
-                            files = list(item.rglob("*"))
-                            total_size = sum(f.stat().st_size for f in files if f.is_file())
-                            
-                            self.orphaned_downloads.append(OrphanedDownload(
-                                library_path=lib_info.path,
-                                app_id=app_id,
-                                files=files,
-                                total_size=total_size
-                            ))
+                    if entry.name.isdigit():
+                        entries.append((entry.name, entry.path, True))
                 
-                elif item.is_file():
+                elif entry.is_file():
                     # Check for depot or state files
-                    if 'depot_' in item.name or 'state_' in item.name:
-                        # Extract app_id from filename
-                        parts = item.name.split('_')
-                        if len(parts) >= 2 and parts[1].isdigit():
-                            app_id = parts[1]
-                            if app_id in self.games and lib_id != '0':
-                                self.orphaned_downloads.append(OrphanedDownload(
-                                    library_path=lib_info.path,
-                                    app_id=app_id,
-                                    files=[item],
-                                    total_size=item.stat().st_size
-                                ))
+                    app_id = get_app_id_from_download_filename(entry.name)
+                    if app_id:
+                        entries.append((app_id, entry.path, False))
+        return entries
+    
+    def _add_issue(self, issue: GameIssue):
+        """Record a detected issue and index it by severity."""
+        self.issues.append(issue)
+        self._issues_by_severity[issue.severity].append(issue)
+    
+    def _add_orphan(self, orphaned: OrphanedDownload):
+        """Record an orphaned download and update summary counters."""
+        self.orphaned_downloads.append(orphaned)
+        self._orphaned_total_size += orphaned.total_size
     
     def get_issues_by_severity(self, severity: str) -> List[GameIssue]:
         """
@@ -216,7 +642,7 @@ class SteamScanner:
         Returns:
             List[GameIssue]: Filtered issues
         """
-        return [issue for issue in self.issues if issue.severity == severity]
+        return self._issues_by_severity.get(severity, [])
     
     def get_summary(self) -> Dict[str, Any]:
         """
@@ -230,10 +656,10 @@ class SteamScanner:
             'active_libraries': sum(1 for lib in self.libraries.values() if lib.exists),
             'total_games': len(self.games),
             'total_issues': len(self.issues),
-            'critical_issues': len(self.get_issues_by_severity('critical')),
-            'warnings': len(self.get_issues_by_severity('warning')),
+            'critical_issues': len(self.get_issues_by_severity(_SEVERITY['critical'])),
+            'warnings': len(self.get_issues_by_severity(_SEVERITY['warning'])),
             'orphaned_downloads': len(self.orphaned_downloads),
-            'orphaned_size': sum(od.total_size for od in self.orphaned_downloads)
+            'orphaned_size': self._orphaned_total_size
         }
     
     def has_issues(self) -> bool:
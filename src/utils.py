@@ -4,19 +4,72 @@ Provides common utility functions used across the application.
 """
 
 import os
+import re
+import sys
+import stat
+import functools
 import platform
 import psutil
 from pathlib import Path
 from typing import Optional
 
 
-def is_steam_running() -> bool:
+# Filename patterns, compiled once
+_APPMANIFEST_RE = re.compile(r'^appmanifest_(\d+)\.acf$')
+_DOWNLOAD_FILE_RE = re.compile(r'^(?:depot|state)_(\d+)(?:_|$)')
+
+# File in the cache directory remembering the detected Steam path
+STEAM_PATH_CACHE_FILE = "steam_path"
+
+# Units used by format_bytes, each 1024 times the previous
+_BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+# Host OS name; platform.system() re-checks uname on each call
+_SYSTEM = platform.system()
+
+# Steam launcher expected in the install directory, per OS
+_STEAM_EXECUTABLES = {
+    'Windows': 'steam.exe',
+    'Linux': 'steam.sh',
+    'Darwin': 'Steam.AppBundle'
+}
+
+# Extra @dataclass options: __slots__ support needs Python 3.10+
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+def _pid_is_steam(pid: int) -> bool:
+    """Check whether a process ID belongs to a live Steam process."""
+    try:
+        return 'steam' in psutil.Process(pid).name().lower()
+    except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess, ValueError):
+        return False
+
+
+def _get_steam_pid() -> Optional[int]:
     """
-    Check if Steam is currently running.
+    Get the PID Steam recorded for its running client, without enumerating processes.
     
     Returns:
-        bool: True if Steam is running, False otherwise
+        Optional[int]: Recorded PID, or None if Steam doesn't publish one here
     """
+    if _SYSTEM == "Windows":
+        try:
+            import winreg
+            with winreg.OpenKey(winreg.HKEY_CURRENT_USER,
+                                r"Software\Valve\Steam\ActiveProcess") as key:
+                return int(winreg.QueryValueEx(key, "pid")[0])
+        except (OSError, ValueError):
+            return None
+    
+    try:
+        return int((Path.home() / ".steam" / "steam.pid").read_text().strip())
+    except (OSError, ValueError):
+        return None
+
+
+def _find_steam_process() -> bool:
+    """Check all running processes for one named like Steam."""
     for proc in psutil.process_iter(['name']):
         try:
             if proc.info['name'] and 'steam' in proc.info['name'].lower():
@@ -26,6 +79,73 @@ def is_steam_running() -> bool:
     return False
 
 
+def is_steam_running() -> bool:
+    """
+    Check if Steam is currently running.
+    
+    The PID Steam records (~/.steam/steam.pid, or the ActiveProcess registry
+    key on Windows) answers quickly when it belongs to a live Steam process.
+    A missing or stale PID proves nothing, so a negative answer always comes
+    from enumerating all processes.
+    
+    Returns:
+        bool: True if Steam is running, False otherwise
+    """
+    pid = _get_steam_pid()
+    if pid is not None and pid > 0 and _pid_is_steam(pid):
+        return True
+    return _find_steam_process()
+
+
+def get_cache_dir() -> Path:
+    """
+    Get the per-user cache directory for Steam Library Fixer.
+    
+    Returns:
+        Path: Cache directory (not created)
+    """
+    if _SYSTEM == "Windows":
+        base = Path(os.environ.get("LOCALAPPDATA", Path.home() / "AppData" / "Local"))
+    else:
+        base = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+    return base / "steam-library-fixer"
+
+
+def _load_cached_steam_path() -> Optional[Path]:
+    """
+    Load the Steam path remembered by a previous run.
+    
+    Returns:
+        Optional[Path]: Cached path if it still has a steamapps folder, else None
+    """
+    try:
+        cached = (get_cache_dir() / STEAM_PATH_CACHE_FILE).read_text(encoding='utf-8').strip()
+    except OSError:
+        return None
+    if not cached:
+        return None
+    
+    # One stat confirms the cached install is still there
+    path = Path(cached)
+    try:
+        if not stat.S_ISDIR(os.stat(path / "steamapps").st_mode):
+            return None
+    except OSError:
+        return None
+    return path
+
+
+def _save_cached_steam_path(path: Path):
+    """Remember the detected Steam path for later runs; failures are ignored."""
+    try:
+        cache_dir = get_cache_dir()
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        (cache_dir / STEAM_PATH_CACHE_FILE).write_text(str(path), encoding='utf-8')
+    except OSError:
+        pass
+
+
+@functools.lru_cache(maxsize=1)
 def get_default_steam_path() -> Optional[Path]:
     """
     Get the default Steam installation path for the current platform.
@@ -33,9 +153,11 @@ def get_default_steam_path() -> Optional[Path]:
     Returns:
         Optional[Path]: Path to Steam directory or None if not found
     """
-    system = platform.system()
+    cached = _load_cached_steam_path()
+    if cached is not None:
+        return cached
     
-    if system == "Windows":
+    if _SYSTEM == "Windows":
         # Check common Windows installation paths
         paths = [
             Path("C:/Program Files (x86)/Steam"),
@@ -43,14 +165,14 @@ def get_default_steam_path() -> Optional[Path]:
             Path(os.environ.get("PROGRAMFILES(X86)", "C:/Program Files (x86)")) / "Steam",
             Path(os.environ.get("PROGRAMFILES", "C:/Program Files")) / "Steam",
         ]
-    elif system == "Linux":
+    elif _SYSTEM == "Linux":
         home = Path.home()
         paths = [
             home / ".steam" / "steam",
             home / ".local" / "share" / "Steam",
             Path("/usr/share/steam"),
         ]
-    elif system == "Darwin":  # macOS
+    elif _SYSTEM == "Darwin":  # macOS
         paths = [
             Path.home() / "Library" / "Application Support" / "Steam",
         ]
@@ -61,6 +183,7 @@ def get_default_steam_path() -> Optional[Path]:
         if path.exists() and path.is_dir():
             steamapps = path / "steamapps"
             if steamapps.exists():
+                _save_cached_steam_path(path)
                 return path
     
     return None
@@ -76,11 +199,11 @@ def format_bytes(bytes_value: int) -> str:
     Returns:
         str: Formatted string (e.g., "1.5 GB")
     """
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if bytes_value < 1024.0:
-            return f"{bytes_value:.2f} {unit}"
-        bytes_value /= 1024.0
-    return f"{bytes_value:.2f} PB"
+    if bytes_value < 1024:
+        return f"{bytes_value:.2f} B"
+    # Each unit is 2**10 of the previous one, so the bit length picks the unit directly
+    unit_index = min((int(bytes_value).bit_length() - 1) // 10, len(_BYTE_UNITS) - 1)
+    return f"{bytes_value / (1 << (10 * unit_index)):.2f} {_BYTE_UNITS[unit_index]}"
 
 
 def safe_path(path: str) -> Path:
@@ -98,6 +221,7 @@ def safe_path(path: str) -> Path:
     return Path(clean_path)
 
 
+@functools.lru_cache(maxsize=8)
 def validate_steam_directory(path: Path) -> bool:
     """
     Validate if a directory is a valid Steam installation.
@@ -108,25 +232,18 @@ def validate_steam_directory(path: Path) -> bool:
     Returns:
         bool: True if valid Steam directory
     """
-    if not path.exists() or not path.is_dir():
-        return False
-    
-    required_files = ['steamapps']
-    required_exe = {
-        'Windows': 'steam.exe',
-        'Linux': 'steam.sh',
-        'Darwin': 'Steam.AppBundle'
-    }
-    
-    # Check for steamapps folder
-    if not (path / 'steamapps').exists():
+    # One stat covers both existence and the directory check
+    try:
+        if not stat.S_ISDIR(os.stat(path).st_mode):
+            return False
+        os.stat(os.path.join(path, 'steamapps'))
+    except OSError:
         return False
     
     # Check for Steam executable
-    system = platform.system()
-    if system in required_exe:
-        if not (path / required_exe[system]).exists():
-            return False
+    exe = _STEAM_EXECUTABLES.get(_SYSTEM)
+    if exe and not os.path.lexists(os.path.join(path, exe)):
+        return False
     
     return True
 
@@ -157,12 +274,22 @@ def get_app_id_from_filename(filename: str) -> Optional[str]:
     Returns:
         Optional[str]: App ID or None
     """
-    try:
-        if filename.startswith('appmanifest_') and filename.endswith('.acf'):
-            return filename.replace('appmanifest_', '').replace('.acf', '')
-    except:
-        pass
-    return None
+    match = _APPMANIFEST_RE.match(filename)
+    return match.group(1) if match else None
+
+
+def get_app_id_from_download_filename(filename: str) -> Optional[str]:
+    """
+    Extract app ID from a depot or state file in a downloading folder.
+    
+    Args:
+        filename: Download filename (e.g., "state_3564740_3564741.patch")
+        
+    Returns:
+        Optional[str]: App ID or None
+    """
+    match = _DOWNLOAD_FILE_RE.match(filename)
+    return match.group(1) if match else None
 
 
 def ensure_directory(path: Path) -> bool:
@@ -3,11 +3,41 @@ Steam Library Fixer - VDF Parser Module
 Parses and writes Valve Data Format (VDF) files used by Steam.
 """
 
-import re
-from typing import Any, Dict, Union
+import io
+import os
+import mmap
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 from pathlib import Path
 
 
+# AppState fields the scanner needs, and how much of a manifest to read for them
+MANIFEST_HEADER_KEYS = ('name', 'installdir', 'StagingFolder', 'SizeOnDisk')
+_MANIFEST_HEADER_LIMIT = 2048
+
+
+def _read_mapped(file_path: Path) -> str:
+    """
+    Read a UTF-8 file through a read-only memory map.
+    
+    The map is decoded straight into a str, skipping the intermediate bytes
+    buffer and text-mode I/O layer, with a sequential-access hint to the kernel.
+    
+    Args:
+        file_path: Path to file
+        
+    Returns:
+        str: File content
+    """
+    with open(file_path, 'rb') as f:
+        # Empty files can't be mapped
+        if os.fstat(f.fileno()).st_size == 0:
+            return ''
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            return str(mm, 'utf-8')
+
+
 class VDFParser:
     """Parser for Valve Data Format files (.vdf and .acf)."""
     
@@ -22,36 +52,40 @@ class VDFParser:
         Returns:
             Dict: Parsed VDF data
         """
-        lines = content.split('\n')
-        return VDFParser._parse_section(lines, 0)[0]
+        # StringIO hands out one line at a time instead of materializing a list of all of them
+        return VDFParser._parse_section(io.StringIO(content))
     
     @staticmethod
-    def _parse_section(lines: list, start_idx: int) -> tuple:
+    def _parse_section(lines: Iterator[str]) -> Dict[str, Any]:
         """
-        Recursively parse a VDF section.
+        Parse VDF lines into nested sections.
+        
+        Open sections are kept on an explicit stack rather than the call stack.
         
         Args:
-            lines: List of file lines
-            start_idx: Starting line index
+            lines: Line iterator; parsing stops at its end or at an unmatched
+                closing brace
             
         Returns:
-            tuple: (parsed_dict, end_index)
+            Dict: Parsed top-level section
         """
-        result = {}
-        i = start_idx
+        stack = [{}]
         current_key = None
         
-        while i < len(lines):
-            line = lines[i].strip()
+        for line in lines:
+            line = line.strip()
             
-            # Skip empty lines and comments
-            if not line or line.startswith('//'):
-                i += 1
+            # Skip empty lines and comments; the first-char test avoids a method call per line
+            if not line or (line[0] == '/' and line[:2] == '//'):
                 continue
             
             # End of section
             if line == '}':
-                return result, i + 1
+                if len(stack) == 1:
+                    break
+                stack.pop()
+                current_key = None
+                continue
             
             # Parse key-value pairs
             tokens = VDFParser._tokenize(line)
@@ -60,35 +94,40 @@ class VDFParser:
                 if tokens[0] == '{':
                     # Start of nested section for current key
                     if current_key:
-                        nested_data, new_idx = VDFParser._parse_section(lines, i + 1)
-                        result[current_key] = nested_data
-                        i = new_idx
+                        section = {}
+                        stack[-1][current_key] = section
+                        stack.append(section)
                         current_key = None
-                    else:
-                        i += 1
                 elif len(tokens) == 1:
                     # Key without value (next line will be {)
                     current_key = tokens[0]
-                    i += 1
                 elif len(tokens) == 2:
                     # Key-value pair
                     key, value = tokens
-                    # Try to convert numeric values
-                    try:
-                        if '.' in value:
-                            value = float(value)
-                        else:
-                            value = int(value)
-                    except ValueError:
-                        pass  # Keep as string
-                    result[key] = value
-                    i += 1
-                else:
-                    i += 1
-            else:
-                i += 1
+                    stack[-1][key] = VDFParser._convert_value(value)
         
-        return result, i
+        return stack[0]
+    
+    @staticmethod
+    def _convert_value(value: str) -> Union[str, int, float]:
+        """
+        Convert a numeric VDF value to int or float.
+        
+        Args:
+            value: Raw value token
+            
+        Returns:
+            Union[str, int, float]: Converted value, or the string if not numeric
+        """
+        # Check the shape first: raising ValueError for every name or path is slow
+        if value.isdecimal():
+            return int(value)
+        digits = value[1:] if value[:1] == '-' else value
+        if digits.isdecimal():
+            return int(value)
+        if '.' in digits and digits.replace('.', '', 1).isdecimal():
+            return float(value)
+        return value  # Keep as string
     
     @staticmethod
     def _tokenize(line: str) -> list:
@@ -101,17 +140,42 @@ class VDFParser:
         Returns:
             list: List of tokens (strings)
         """
-        tokens = []
-        # Match quoted strings and unquoted tokens
-        pattern = r'"([^"]*)"|(\S+)'
-        matches = re.findall(pattern, line)
+        if '"' not in line:
+            return line.split()
+        
+        parts = line.split('"')
+        
+        # Dominant shapes on stripped lines: "key"\t\t"value" and a section's "key"
+        if len(parts) == 5:
+            before, key, sep, value, after = parts
+            if not before and not after and (not sep or sep.isspace()):
+                return [key, value]
+        elif len(parts) == 3 and not parts[0] and not parts[2]:
+            return [parts[1]]
         
-        for match in matches:
-            # match is a tuple (quoted_content, unquoted_content)
-            token = match[0] if match[0] else match[1]
-            if token:
-                tokens.append(token)
+        # Any other run of quoted tokens separated by whitespace
+        if len(parts) % 2 == 1 and not ''.join(parts[0::2]).strip():
+            return parts[1::2]
         
+        # Mixed quoted and bare tokens; an unterminated quote starts a bare token
+        tokens = []
+        i = 0
+        n = len(line)
+        while i < n:
+            if line[i].isspace():
+                i += 1
+                continue
+            if line[i] == '"':
+                j = line.find('"', i + 1)
+                if j != -1:
+                    tokens.append(line[i + 1:j])
+                    i = j + 1
+                    continue
+            j = i + 1
+            while j < n and not line[j].isspace():
+                j += 1
+            tokens.append(line[i:j])
+            i = j
         return tokens
     
     @staticmethod
@@ -127,20 +191,33 @@ class VDFParser:
             str: VDF formatted string
         """
         lines = []
+        VDFParser._write_into(data, indent_level, lines)
+        return '\n'.join(lines)
+    
+    @staticmethod
+    def _write_into(data: Dict[str, Any], indent_level: int, lines: List[str]):
+        """
+        Append the VDF lines for a dictionary to a shared list.
+        
+        Args:
+            data: Dictionary to convert
+            indent_level: Current indentation level
+            lines: Output lines, joined once by write()
+        """
         indent = '\t' * indent_level
+        open_brace = indent + '{'
+        close_brace = indent + '}'
         
         for key, value in data.items():
             if isinstance(value, dict):
                 # Nested section
                 lines.append(f'{indent}"{key}"')
-                lines.append(f'{indent}{{')
-                lines.append(VDFParser.write(value, indent_level + 1))
-                lines.append(f'{indent}}}')
+                lines.append(open_brace)
+                VDFParser._write_into(value, indent_level + 1, lines)
+                lines.append(close_brace)
             else:
                 # Key-value pair
                 lines.append(f'{indent}"{key}"\t\t"{value}"')
-        
-        return '\n'.join(lines)
     
     @staticmethod
     def read_file(file_path: Path) -> Dict[str, Any]:
@@ -153,29 +230,40 @@ class VDFParser:
         Returns:
             Dict: Parsed VDF data
         """
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        return VDFParser.parse(content)
+        # Decoded straight from the mapping; parse() strips any '\r'
+        return VDFParser.parse(_read_mapped(file_path))
     
     @staticmethod
-    def write_file(data: Dict[str, Any], file_path: Path) -> bool:
+    def write_file(data: Dict[str, Any], file_path: Path):
         """
         Write dictionary to VDF file.
         
+        The content goes to a temporary file that is synced to disk and then
+        replaces the target, so neither Steam nor a crash or power loss can leave
+        a partially written file.
+        
         Args:
             data: Dictionary to write
             file_path: Output file path
             
-        Returns:
-            bool: True if successful
+        Raises:
+            OSError: If the file can't be written
         """
+        content = VDFParser.write(data).encode('utf-8')
+        tmp_path = f"{file_path}.tmp"
         try:
-            content = VDFParser.write(data)
-            with open(file_path, 'w', encoding='utf-8', newline='') as f:
+            with open(tmp_path, 'wb') as f:
                 f.write(content)
-            return True
-        except Exception:
-            return False
+                f.flush()
+                # Without this, a crash after the rename can leave an empty file on ext4/NTFS
+                os.fsync(f.fileno())
+            os.replace(tmp_path, file_path)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
 
 
 def read_manifest(manifest_path: Path) -> Dict[str, Any]:
@@ -188,10 +276,62 @@ def read_manifest(manifest_path: Path) -> Dict[str, Any]:
     Returns:
         Dict: Parsed manifest data
     """
-    return VDFParser.read_file(manifest_path)
+    return VDFParser.parse(_read_mapped(manifest_path))
 
 
-def write_manifest(data: Dict[str, Any], manifest_path: Path) -> bool:
+def read_manifest_header(manifest_path: Path, keys: Tuple[str, ...] = MANIFEST_HEADER_KEYS,
+                         limit: int = _MANIFEST_HEADER_LIMIT) -> Optional[Dict[str, Any]]:
+    """
+    Read selected top-level AppState fields from the start of a manifest.
+    
+    Steam usually writes the scalar AppState fields before nested sections such
+    as InstalledDepots, so they are found within the first few hundred bytes.
+    Nested sections are skipped, and a key is only reported absent once the
+    closing brace of AppState has been read.
+    
+    Args:
+        manifest_path: Path to manifest file
+        keys: AppState keys to extract
+        limit: Maximum number of bytes to read
+        
+    Returns:
+        Optional[Dict]: {'AppState': {key: value}} with every requested key that is
+        present, or None if the header alone can't tell (use read_manifest then)
+    """
+    with open(manifest_path, 'rb') as f:
+        head = f.read(limit + 1)
+    
+    if len(head) > limit:
+        # Drop the partial last line, which may also split a UTF-8 sequence
+        head = head[:head.rfind(b'\n', 0, limit) + 1]
+    
+    wanted = set(keys)
+    found = {}
+    depth = 0
+    for line in head.decode('utf-8').split('\n'):
+        line = line.strip()
+        if not line or line.startswith('//'):
+            continue
+        if line == '{':
+            depth += 1
+            continue
+        if line == '}':
+            depth -= 1
+            # End of AppState: anything not seen is absent
+            if depth == 0:
+                return {'AppState': found}
+            continue
+        
+        tokens = VDFParser._tokenize(line)
+        if depth == 1 and len(tokens) == 2 and tokens[0] in wanted:
+            found[tokens[0]] = VDFParser._convert_value(tokens[1])
+            if len(found) == len(wanted):
+                return {'AppState': found}
+    
+    return None
+
+
+def write_manifest(data: Dict[str, Any], manifest_path: Path):
     """
     Write manifest data to file.
     
@@ -199,10 +339,10 @@ def write_manifest(data: Dict[str, Any], manifest_path: Path) -> bool:
         data: Manifest dictionary
         manifest_path: Output path
         
-    Returns:
-        bool: True if successful
+    Raises:
+        OSError: If the file can't be written
     """
-    return VDFParser.write_file(data, manifest_path)
+    VDFParser.write_file(data, manifest_path)
 
 
 def read_library_folders(vdf_path: Path) -> Dict[str, Any]:
@@ -218,7 +358,7 @@ def read_library_folders(vdf_path: Path) -> Dict[str, Any]:
     return VDFParser.read_file(vdf_path)
 
 
-def write_library_folders(data: Dict[str, Any], vdf_path: Path) -> bool:
+def write_library_folders(data: Dict[str, Any], vdf_path: Path):
     """
     Write library folders data to file.
     
@@ -226,7 +366,7 @@ def write_library_folders(data: Dict[str, Any], vdf_path: Path) -> bool:
         data: Library folders dictionary
         vdf_path: Output path
         
-    Returns:
-        bool: True if successful
+    Raises:
+        OSError: If the file can't be written
     """
-    return VDFParser.write_file(data, vdf_path)
+    VDFParser.write_file(data, vdf_path)
@@ -0,0 +1,145 @@
+"""
+Test backup manager
+"""
+
+import pytest
+from dataclasses import asdict
+import src.backup as backup
+from src.backup import (
+    BackupEntry, BackupManifest, BackupManager,
+    _fast_copy, _dumps_json, _loads_json, _manifest_to_dict
+)
+
+
+def test_fast_copy(tmp_path):
+    """Test copying file contents and empty files."""
+    src = tmp_path / "appmanifest_1.acf"
+    src.write_text('"AppState"\n{\n}\n', encoding='utf-8')
+    dst = tmp_path / "copy.acf"
+    _fast_copy(src, dst)
+    assert dst.read_bytes() == src.read_bytes()
+
+    empty = tmp_path / "empty.acf"
+    empty.touch()
+    _fast_copy(empty, tmp_path / "empty_copy.acf")
+    assert (tmp_path / "empty_copy.acf").read_bytes() == b""
+
+
+def test_backup_and_restore(tmp_path):
+    """Test backing up files and restoring them."""
+    steamapps = tmp_path / "steam" / "steamapps"
+    steamapps.mkdir(parents=True)
+    manifest = steamapps / "appmanifest_123.acf"
+    manifest.write_text('"AppState"\n{\n\t"StagingFolder"\t\t"1"\n}\n', encoding='utf-8')
+
+    manager = BackupManager(tmp_path / "backups")
+    backup_id = manager.create_backup([manifest], "Test backup")
+
+    manifest.write_text("changed", encoding='utf-8')
+    assert manager.restore_backup(backup_id)
+    assert '"StagingFolder"' in manifest.read_text(encoding='utf-8')
+
+    backups = manager.list_backups()
+    assert len(backups) == 1
+    assert backups[0].backup_id == backup_id
+    assert backups[0].files[0].file_size == manifest.stat().st_size
+
+
+def test_manifest_cache(tmp_path):
+    """Test manifests are reused until deleted."""
+    steamapps = tmp_path / "steamapps"
+    steamapps.mkdir()
+    manifest = steamapps / "appmanifest_1.acf"
+    manifest.write_text("data", encoding='utf-8')
+
+    manager = BackupManager(tmp_path / "backups")
+    backup_id = manager.create_backup([manifest])
+    first = manager.get_backup(backup_id)
+    assert manager.list_backups()[0] is first
+
+    assert manager.delete_backup(backup_id)
+    assert manager.get_backup(backup_id) is None
+    assert manager.list_backups() == []
+
+
+def test_human_readable_manifest(tmp_path):
+    """Test JSON manifests are written on request and readable as legacy backups."""
+    manifest = tmp_path / "appmanifest_1.acf"
+    manifest.write_text("data", encoding='utf-8')
+
+    manager = BackupManager(tmp_path / "backups", human_readable=True)
+    backup_id = manager.create_backup([manifest])
+    assert (tmp_path / "backups" / backup_id / "manifest.json").exists()
+
+    if backup.msgpack is not None:
+        (tmp_path / "backups" / backup_id / "manifest.msgpack").unlink()
+    assert BackupManager(tmp_path / "backups").get_backup(backup_id).backup_id == backup_id
+
+
+def test_msgpack_manifest_without_msgpack(tmp_path, monkeypatch):
+    """Test a msgpack-only backup fails loudly instead of vanishing without msgpack."""
+    pytest.importorskip('msgpack')
+    manifest = tmp_path / "appmanifest_1.acf"
+    manifest.write_text("data", encoding='utf-8')
+    manager = BackupManager(tmp_path / "backups")
+    backup_id = manager.create_backup([manifest])
+
+    monkeypatch.setattr(backup, 'msgpack', None)
+    manager = BackupManager(tmp_path / "backups")
+    with pytest.raises(ImportError, match="msgpack"):
+        manager.list_backups()
+    with pytest.raises(ImportError, match="msgpack"):
+        manager.restore_backup(backup_id)
+
+
+def test_manifest_to_dict():
+    """Test the manifest dict builder matches dataclasses.asdict."""
+    entry = BackupEntry("a.acf", "backup/a.acf", "20250101_000000", 10)
+    manifest = BackupManifest("backup_1", "20250101_000000", "steam", [entry], "Test")
+    assert _manifest_to_dict(manifest) == asdict(manifest)
+
+
+def test_json_roundtrip_without_orjson(monkeypatch):
+    """Test manifest serialization falls back to stdlib json."""
+    data = {'backup_id': 'backup_1', 'files': [{'file_size': 3}]}
+    assert _loads_json(_dumps_json(data)) == data
+
+    monkeypatch.setattr(backup, 'orjson', None)
+    assert _loads_json(_dumps_json(data)) == data
+
+
+def test_clone_macos_replaces_dst(tmp_path, monkeypatch):
+    """Test clonefile targets a temp name and only then replaces dst."""
+    class FakeLibc:
+        def __init__(self, ok):
+            self.ok = ok
+            self.targets = []
+
+        def clonefile(self, src, dst, flags):
+            self.targets.append(dst)
+            if not self.ok:
+                return -1
+            with open(src, 'rb') as fsrc, open(dst, 'xb') as fdst:
+                fdst.write(fsrc.read())
+            return 0
+
+    src = tmp_path / "src.vdf"
+    src.write_text("new")
+    dst = tmp_path / "dst.vdf"
+    dst.write_text("old")
+
+    libc = FakeLibc(ok=False)
+    monkeypatch.setattr(backup, '_libc', libc, raising=False)
+    assert not backup._clone_macos(src, dst)
+    assert dst.read_text() == "old"
+
+    libc = FakeLibc(ok=True)
+    monkeypatch.setattr(backup, '_libc', libc, raising=False)
+    assert backup._clone_macos(src, dst)
+    assert dst.read_text() == "new"
+    assert libc.targets != [bytes(dst)]
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["dst.vdf", "src.vdf"]
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
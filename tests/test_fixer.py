@@ -0,0 +1,95 @@
+"""
+Test Steam fixer
+"""
+
+import pytest
+import src.fixer as fixer
+from src.fixer import SteamFixer
+from src.scanner import GameIssue, OrphanedDownload
+
+
+@pytest.fixture
+def downloading(tmp_path):
+    """Create a library downloading folder."""
+    path = tmp_path / "library" / "steamapps" / "downloading"
+    path.mkdir(parents=True)
+    return path
+
+
+def _orphan(downloading, name, is_dir=True):
+    return OrphanedDownload(
+        library_path=downloading.parent.parent,
+        app_id='20',
+        path=str(downloading / name),
+        is_dir=is_dir,
+        file_count=0,
+        total_size=0
+    )
+
+
+def test_delete_orphaned_dir(downloading):
+    """Test an orphaned app folder is removed as one tree."""
+    (downloading / "20" / "sub").mkdir(parents=True)
+    (downloading / "20" / "chunk").write_bytes(b"x")
+    (downloading / "20" / "sub" / "chunk").write_bytes(b"x")
+
+    SteamFixer(None, None)._delete_orphaned_files(_orphan(downloading, "20"))
+
+    assert not (downloading / "20").exists()
+    assert downloading.is_dir()
+
+
+def test_delete_orphaned_file(downloading):
+    """Test an orphaned state file is removed and the downloading folder survives."""
+    (downloading / "state_20_1.patch").write_bytes(b"x")
+
+    orphaned = _orphan(downloading, "state_20_1.patch", is_dir=False)
+    SteamFixer(None, None)._delete_orphaned_files(orphaned)
+
+    assert downloading.is_dir()
+    assert list(downloading.iterdir()) == []
+
+
+def test_delete_orphaned_failure(downloading, monkeypatch):
+    """Test a failed delete is logged as a warning instead of raised."""
+    (downloading / "20").mkdir()
+    warnings = []
+
+    def deny(path):
+        raise PermissionError(path)
+
+    monkeypatch.setattr(fixer.shutil, 'rmtree', deny)
+    steam_fixer = SteamFixer(None, None)
+    monkeypatch.setattr(steam_fixer.logger, 'warning',
+                        lambda msg, *args: warnings.append(msg % args))
+    steam_fixer._delete_orphaned_files(_orphan(downloading, "20"))
+
+    assert (downloading / "20").is_dir()
+    assert len(warnings) == 1 and warnings[0].startswith("  Failed to delete 20")
+
+
+def test_fix_staging_without_appstate(tmp_path):
+    """Test a manifest without AppState counts as failed and isn't rewritten."""
+    manifest = tmp_path / "appmanifest_20.acf"
+    manifest.write_text('"Other"\n{\n\t"appid"\t\t"20"\n}\n', encoding='utf-8')
+    before = manifest.read_bytes()
+    issue = GameIssue(
+        app_id='20',
+        game_name='Game 20',
+        issue_type='staging_folder_mismatch',
+        severity='warning',
+        description='StagingFolder points at the wrong library',
+        current_value=1,
+        expected_value=0,
+        manifest_path=manifest
+    )
+
+    steam_fixer = SteamFixer(None, None)
+    assert not steam_fixer._fix_staging_folders(manifest, [issue])
+    assert (steam_fixer.fixed_count, steam_fixer.failed_count) == (0, 1)
+    assert steam_fixer.fixed_app_ids == set()
+    assert manifest.read_bytes() == before
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
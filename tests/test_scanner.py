@@ -0,0 +1,207 @@
+"""
+Test Steam scanner
+"""
+
+import os
+import pytest
+from pathlib import Path
+import src.scanner as scanner_module
+from src.scanner import SteamScanner, _tree_size
+
+
+def _write_manifest(steamapps: Path, app_id: int, staging_folder=None):
+    staging = f'\t"StagingFolder"\t\t"{staging_folder}"\n' if staging_folder is not None else ''
+    (steamapps / f"appmanifest_{app_id}.acf").write_text(
+        f'"AppState"\n{{\n\t"appid"\t\t"{app_id}"\n\t"name"\t\t"Game {app_id}"\n{staging}}}\n',
+        encoding='utf-8'
+    )
+
+
+@pytest.fixture
+def steam_dir(tmp_path):
+    """Create a Steam install with one extra library and one missing library."""
+    steam = tmp_path / "steam"
+    steamapps = steam / "steamapps"
+    steamapps.mkdir(parents=True)
+    library = tmp_path / "library"
+    downloading = library / "steamapps" / "downloading"
+    (downloading / "20" / "sub").mkdir(parents=True)
+    (downloading / "20" / "chunk").write_bytes(b"x" * 100)
+    (downloading / "20" / "sub" / "chunk").write_bytes(b"x" * 50)
+
+    (steamapps / "libraryfolders.vdf").write_text(
+        '"libraryfolders"\n{\n'
+        f'\t"0"\n\t{{\n\t\t"path"\t\t"{steam.as_posix()}"\n\t}}\n'
+        f'\t"1"\n\t{{\n\t\t"path"\t\t"{library.as_posix()}"\n\t}}\n'
+        f'\t"2"\n\t{{\n\t\t"path"\t\t"{(tmp_path / "missing").as_posix()}"\n\t}}\n'
+        '}\n',
+        encoding='utf-8'
+    )
+    _write_manifest(steamapps, 20, staging_folder=1)
+    _write_manifest(steamapps, 30, staging_folder=2)
+    _write_manifest(steamapps, 40)
+    _write_manifest(steamapps, 50, staging_folder=0)
+    return steam
+
+
+def test_scan(steam_dir):
+    """Test scanning games, issues and orphaned downloads."""
+    scanner = SteamScanner(steam_dir, use_cache=False)
+    assert scanner.scan()
+
+    assert set(scanner.games) == {'20', '30', '40', '50'}
+    issues = {issue.app_id: issue for issue in scanner.issues}
+    assert set(issues) == {'20', '30'}
+    assert issues['20'].issue_type == 'staging_folder_mismatch'
+    assert issues['30'].issue_type == 'missing_staging_library'
+    assert issues['30'].severity == 'critical'
+
+    summary = scanner.get_summary()
+    assert summary['total_libraries'] == 3
+    assert summary['active_libraries'] == 2
+    assert summary['critical_issues'] == 1
+    assert summary['orphaned_downloads'] == 1
+    assert summary['orphaned_size'] == 150
+
+    orphaned = scanner.orphaned_downloads[0]
+    assert orphaned.file_count == 2
+    assert len(list(orphaned.iter_files())) == 3
+
+
+def test_scan_staging_after_depots(steam_dir):
+    """Test StagingFolder written after InstalledDepots is still detected."""
+    for app_id, depot_count in ((60, 1), (70, 500)):
+        depots = '\t\t"1"\t\t"2"\n' * depot_count
+        (steam_dir / "steamapps" / f"appmanifest_{app_id}.acf").write_text(
+            f'"AppState"\n{{\n\t"name"\t\t"Game {app_id}"\n'
+            f'\t"InstalledDepots"\n\t{{\n{depots}\t}}\n'
+            '\t"StagingFolder"\t\t"1"\n}\n',
+            encoding='utf-8'
+        )
+    scanner = SteamScanner(steam_dir, use_cache=False)
+    scanner.scan()
+    assert scanner.games['60']['staging_folder'] == 1
+    assert scanner.games['70']['staging_folder'] == 1
+    issues = {issue.app_id: issue for issue in scanner.issues}
+    assert issues['60'].issue_type == 'staging_folder_mismatch'
+    assert issues['70'].issue_type == 'staging_folder_mismatch'
+
+
+def test_tree_size(tmp_path, monkeypatch):
+    """Test tree sizing with and without os.fwalk."""
+    (tmp_path / "a" / "b").mkdir(parents=True)
+    (tmp_path / "a" / "one").write_bytes(b"x" * 3)
+    (tmp_path / "a" / "b" / "two").write_bytes(b"x" * 4)
+    assert _tree_size(str(tmp_path / "a")) == (2, 7)
+
+    monkeypatch.setattr('src.scanner._HAVE_FWALK', False)
+    assert _tree_size(str(tmp_path / "a")) == (2, 7)
+    with pytest.raises(FileNotFoundError):
+        _tree_size(str(tmp_path / "missing"))
+
+    # Unreadable subdirectories are skipped rather than failing the walk
+    scandir = os.scandir
+
+    def deny(path):
+        if str(path).endswith("b"):
+            raise PermissionError(path)
+        return scandir(path)
+
+    monkeypatch.setattr('src.scanner.os.scandir', deny)
+    assert _tree_size(str(tmp_path / "a")) == (1, 3)
+
+
+def test_scan_unreadable_download(steam_dir, monkeypatch):
+    """Test an unreadable download folder doesn't abort the scan."""
+    def deny(root):
+        raise PermissionError(root)
+
+    monkeypatch.setattr('src.scanner._tree_size', deny)
+    scanner = SteamScanner(steam_dir, use_cache=False)
+    assert scanner.scan()
+    assert scanner.orphaned_downloads == []
+
+
+def test_scan_cache(steam_dir, tmp_path, monkeypatch):
+    """Test unchanged manifests are reused from the scan cache."""
+    cache_dir = tmp_path / "cache"
+    SteamScanner(steam_dir, cache_dir=cache_dir).scan()
+    assert (cache_dir / "scan.bin").exists()
+
+    def fail(path):
+        raise AssertionError(f"{path} should come from the cache")
+
+    monkeypatch.setattr('src.scanner.read_manifest', fail)
+    monkeypatch.setattr('src.scanner.read_manifest_header', fail)
+    scanner = SteamScanner(steam_dir, cache_dir=cache_dir)
+    scanner.scan()
+    assert set(scanner.games) == {'20', '30', '40', '50'}
+    assert len(scanner.issues) == 2
+
+
+def test_scan_cache_format(steam_dir, tmp_path, monkeypatch):
+    """Test a cache written with another format is ignored."""
+    cache_dir = tmp_path / "cache"
+    SteamScanner(steam_dir, cache_dir=cache_dir).scan()
+
+    monkeypatch.setattr('src.scanner._SCAN_CACHE_FORMAT', -1)
+    parsed = []
+    read_header = scanner_module.read_manifest_header
+
+    def record(path):
+        parsed.append(path)
+        return read_header(path)
+
+    monkeypatch.setattr('src.scanner.read_manifest_header', record)
+    SteamScanner(steam_dir, cache_dir=cache_dir).scan()
+    assert len(parsed) == 4
+
+
+def test_downloads_cache(steam_dir, tmp_path, monkeypatch):
+    """Test orphan sizes are reused while the downloading folder is unchanged."""
+    cache_dir = tmp_path / "cache"
+    SteamScanner(steam_dir, cache_dir=cache_dir).scan()
+
+    def fail(root):
+        raise AssertionError(f"{root} should come from the cache")
+
+    monkeypatch.setattr('src.scanner._tree_size', fail)
+    scanner = SteamScanner(steam_dir, cache_dir=cache_dir)
+    scanner.scan()
+    assert scanner.get_summary()['orphaned_size'] == 150
+
+    # A new entry in downloading/ invalidates the cached listing
+    monkeypatch.undo()
+    (tmp_path / "library" / "steamapps" / "downloading" / "state_30_1.patch").write_bytes(b"x" * 7)
+    scanner = SteamScanner(steam_dir, cache_dir=cache_dir)
+    scanner.scan()
+    assert scanner.get_summary()['orphaned_size'] == 157
+
+    # Writes inside an app folder leave downloading/ alone but still re-size that app
+    downloading = tmp_path / "library" / "steamapps" / "downloading"
+    stat = downloading.stat()
+    (downloading / "20" / "chunk2").write_bytes(b"x" * 10)
+    os.utime(downloading / "20", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    os.utime(downloading, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    scanner.scan()
+    assert scanner.get_summary()['orphaned_size'] == 167
+
+
+def test_rescan(steam_dir):
+    """Test rescanning only the given games."""
+    scanner = SteamScanner(steam_dir, use_cache=False)
+    scanner.scan()
+
+    steamapps = steam_dir / "steamapps"
+    _write_manifest(steamapps, 20, staging_folder=0)
+    _write_manifest(steamapps, 40, staging_folder=1)
+    scanner.rescan(app_ids={'20'})
+
+    assert {issue.app_id for issue in scanner.issues} == {'30'}
+    assert scanner.games['40'].get('staging_folder') is None
+    assert len(scanner.get_issues_by_severity('warning')) == 0
+    assert scanner.get_summary()['orphaned_downloads'] == 1
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -3,7 +3,10 @@ Test utilities
 """
 
 import pytest
-from src.utils import format_bytes, get_app_id_from_filename
+import src.utils as utils
+from src.utils import (
+    format_bytes, get_app_id_from_filename, get_app_id_from_download_filename, is_steam_running
+)
 
 
 def test_format_bytes():
@@ -11,6 +14,10 @@ def test_format_bytes():
     assert format_bytes(1024) == "1.00 KB"
     assert format_bytes(1048576) == "1.00 MB"
     assert format_bytes(1073741824) == "1.00 GB"
+    assert format_bytes(0) == "0.00 B"
+    assert format_bytes(1023) == "1023.00 B"
+    assert format_bytes(1536) == "1.50 KB"
+    assert format_bytes(1024 ** 6) == "1024.00 PB"
 
 
 def test_get_app_id_from_filename():
@@ -18,6 +25,72 @@ def test_get_app_id_from_filename():
     assert get_app_id_from_filename("appmanifest_3564740.acf") == "3564740"
     assert get_app_id_from_filename("appmanifest_123.acf") == "123"
     assert get_app_id_from_filename("invalid.acf") is None
+    assert get_app_id_from_filename("appmanifest_abc.acf") is None
+
+
+def test_get_app_id_from_download_filename():
+    """Test extracting app ID from depot and state filenames."""
+    assert get_app_id_from_download_filename("depot_3564740_1.bin") == "3564740"
+    assert get_app_id_from_download_filename("state_123_456.patch") == "123"
+    assert get_app_id_from_download_filename("state_123") == "123"
+    assert get_app_id_from_download_filename("state_123.bin") is None
+    assert get_app_id_from_download_filename("readme.txt") is None
+
+
+def test_get_default_steam_path_uses_cache(tmp_path, monkeypatch):
+    """Test a remembered Steam path is reused while it still exists."""
+    steam = tmp_path / "steam"
+    (steam / "steamapps").mkdir(parents=True)
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(utils, 'get_cache_dir', lambda: cache_dir)
+
+    utils._save_cached_steam_path(steam)
+    utils.get_default_steam_path.cache_clear()
+    assert utils.get_default_steam_path() == steam
+    utils.get_default_steam_path.cache_clear()
+
+    (steam / "steamapps").rmdir()
+    assert utils._load_cached_steam_path() is None
+
+
+def test_validate_steam_directory(tmp_path, monkeypatch):
+    """Test Steam directory validation on a Linux layout."""
+    monkeypatch.setattr(utils, '_SYSTEM', 'Linux')
+    utils.validate_steam_directory.cache_clear()
+    steam = tmp_path / "steam"
+    (steam / "steamapps").mkdir(parents=True)
+    assert not utils.validate_steam_directory(steam)
+    assert not utils.validate_steam_directory(tmp_path / "missing")
+    assert not utils.validate_steam_directory(steam / "steamapps" / "x")
+
+    (steam / "steam.sh").touch()
+    utils.validate_steam_directory.cache_clear()
+    assert utils.validate_steam_directory(steam)
+    utils.validate_steam_directory.cache_clear()
+
+
+def test_is_steam_running_uses_recorded_pid(monkeypatch):
+    """Test a live Steam PID is trusted without enumerating processes."""
+    monkeypatch.setattr(utils, '_get_steam_pid', lambda: 1234)
+    monkeypatch.setattr(utils, '_pid_is_steam', lambda pid: pid == 1234)
+    monkeypatch.setattr(utils.psutil, 'process_iter', None)
+    assert is_steam_running()
+
+
+def test_is_steam_running_stale_pid(monkeypatch):
+    """Test a stale recorded PID falls back to enumerating processes."""
+    class Proc:
+        def __init__(self, name):
+            self.info = {'name': name}
+
+    monkeypatch.setattr(utils, '_get_steam_pid', lambda: 1234)
+    monkeypatch.setattr(utils, '_pid_is_steam', lambda pid: False)
+    monkeypatch.setattr(utils.psutil, 'process_iter',
+                        lambda attrs: [Proc('bash'), Proc('steamwebhelper')])
+    assert is_steam_running()
+
+    monkeypatch.setattr(utils.psutil, 'process_iter', lambda attrs: [Proc('bash')])
+    assert not is_steam_running()
 
 
 if __name__ == '__main__':
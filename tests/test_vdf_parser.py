@@ -4,7 +4,7 @@ Basic tests for Steam Library Fixer
 
 import pytest
 from pathlib import Path
-from src.vdf_parser import VDFParser
+from src.vdf_parser import VDFParser, read_manifest, read_manifest_header
 
 
 def test_vdf_parser_simple():
@@ -23,6 +23,31 @@ def test_vdf_parser_simple():
     assert result['TestKey']['number'] == 42
 
 
+def test_vdf_parser_empty_value():
+    """Test empty quoted values are kept as empty strings."""
+    result = VDFParser.parse('"AppState"\n{\n\t"LauncherPath"\t\t""\n\t"name"\t\t"Game"\n}\n')
+    assert result == {'AppState': {'LauncherPath': '', 'name': 'Game'}}
+
+
+def test_convert_value():
+    """Test numeric conversion of VDF values."""
+    assert VDFParser._convert_value('42') == 42
+    assert VDFParser._convert_value('-3') == -3
+    assert VDFParser._convert_value('1.5') == 1.5
+    assert VDFParser._convert_value('-.5') == -0.5
+    for value in ('', '-', '.', '1.2.3', 'Some Game', '3D', 'C:\\Games'):
+        assert VDFParser._convert_value(value) == value
+
+
+def test_tokenize():
+    """Test tokenizing quoted, bare and mixed VDF lines."""
+    assert VDFParser._tokenize('"name"\t\t"Some Game"') == ['name', 'Some Game']
+    assert VDFParser._tokenize('{') == ['{']
+    assert VDFParser._tokenize('"key" value') == ['key', 'value']
+    assert VDFParser._tokenize('"key" "unterminated') == ['key', '"unterminated']
+    assert VDFParser._tokenize('a"b" "c"') == ['a"b"', 'c']
+
+
 def test_vdf_parser_nested():
     """Test parsing nested VDF structure."""
     content = '''
@@ -42,6 +67,16 @@ def test_vdf_parser_nested():
     assert result['Root']['Level1']['Level2']['value'] == 'deep'
 
 
+def test_vdf_parser_deep_nesting():
+    """Test nesting deeper than the recursion limit."""
+    depth = 2000
+    content = '"k"\n{\n' * depth + '"v"\t"1"\n' + '}\n' * depth
+    section = VDFParser.parse(content)
+    for _ in range(depth):
+        section = section['k']
+    assert section == {'v': 1}
+
+
 def test_vdf_write():
     """Test writing VDF format."""
     data = {
@@ -58,5 +93,69 @@ def test_vdf_write():
     assert '"Test Game"' in output
 
 
+def test_write_file(tmp_path):
+    """Test writing VDF files atomically and reporting failures."""
+    vdf = tmp_path / "libraryfolders.vdf"
+    vdf.write_text("old", encoding='utf-8')
+    data = {'libraryfolders': {'0': {'path': 'C:\\Steam'}}}
+    VDFParser.write_file(data, vdf)
+    assert VDFParser.read_file(vdf) == data
+    assert [p.name for p in tmp_path.iterdir()] == ["libraryfolders.vdf"]
+
+    with pytest.raises(OSError):
+        VDFParser.write_file(data, tmp_path / "missing" / "libraryfolders.vdf")
+
+
+def test_read_manifest(tmp_path):
+    """Test reading manifest files, including empty ones."""
+    manifest = tmp_path / "appmanifest_1.acf"
+    manifest.write_bytes(b'"AppState"\r\n{\r\n\t"name"\t\t"Caf\xc3\xa9"\r\n}\r\n')
+    assert read_manifest(manifest) == {'AppState': {'name': 'Café'}}
+
+    manifest.write_bytes(b'')
+    assert read_manifest(manifest) == {}
+
+
+def test_read_file_crlf(tmp_path):
+    """Test reading VDF files with Windows line endings."""
+    vdf = tmp_path / "libraryfolders.vdf"
+    vdf.write_bytes(
+        b'"libraryfolders"\r\n{\r\n\t"0"\r\n\t{\r\n\t\t"path"\t\t"C:\\\\Steam"\r\n\t}\r\n}\r\n'
+    )
+    assert VDFParser.read_file(vdf) == {'libraryfolders': {'0': {'path': 'C:\\\\Steam'}}}
+
+
+def test_read_manifest_header(tmp_path):
+    """Test reading AppState fields from the start of a manifest."""
+    manifest = tmp_path / "appmanifest_1.acf"
+    depots = '\t"InstalledDepots"\n\t{\n' + '\t\t"1"\t\t"2"\n' * 500 + '\t}\n'
+    manifest.write_text(
+        '"AppState"\n{\n\t"name"\t\t"Game"\n\t"installdir"\t\t"game"\n'
+        '\t"SizeOnDisk"\t\t"100"\n\t"StagingFolder"\t\t"1"\n' + depots + '}\n',
+        encoding='utf-8'
+    )
+    assert read_manifest_header(manifest) == {'AppState': {
+        'name': 'Game', 'installdir': 'game', 'SizeOnDisk': 100, 'StagingFolder': 1
+    }}
+
+    # Keys after a nested section are still found
+    manifest.write_text(
+        '"AppState"\n{\n\t"name"\t\t"Game"\n\t"InstalledDepots"\n\t{\n\t\t"1"\n\t\t{\n\t\t}\n\t}\n'
+        '\t"StagingFolder"\t\t"1"\n}\n',
+        encoding='utf-8'
+    )
+    assert read_manifest_header(manifest) == {'AppState': {'name': 'Game', 'StagingFolder': 1}}
+
+    # Reaching the limit before AppState closes needs the full parse
+    manifest.write_text('"AppState"\n{\n\t"name"\t\t"Game"\n' + depots + '}\n', encoding='utf-8')
+    assert read_manifest_header(manifest) is None
+    header = read_manifest_header(manifest, keys=('name',), limit=30)
+    assert header == {'AppState': {'name': 'Game'}}
+
+    # A short manifest read to its end reports missing keys as absent
+    manifest.write_text('"AppState"\n{\n\t"name"\t\t"Game"\n}\n', encoding='utf-8')
+    assert read_manifest_header(manifest) == {'AppState': {'name': 'Game'}}
+
+
 if __name__ == '__main__':
     pytest.main([__file__])